@@ -6,8 +6,10 @@ from typing import TYPE_CHECKING
 
 from homeassistant.helpers import device_registry as dr
 
-from .bridge import PLATFORMS, AmpioBridge, AmpioConfigEntry
-from .const import DOMAIN
+from .bridge import AmpioBridge, AmpioConfigEntry
+from .const import CONF_CONFIG, CONF_CONFIG_HASH, DOMAIN
+from .services import async_setup_services
+from .storage import async_remove_config, async_save_config, config_hash
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -20,15 +22,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     Configuration through YAML is not supported at this time.
     """
+    async_setup_services(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: AmpioConfigEntry) -> bool:
+    """Migrate old entry."""
+    if entry.version < 3:  # noqa: PLR2004
+        # move the parsed config out of the entry into the storage cache
+        data = {**entry.data}
+        config = data.pop(CONF_CONFIG, {})
+        hash_ = config_hash(config)
+        await async_save_config(hass, hash_, config)
+        data[CONF_CONFIG_HASH] = hash_
+        hass.config_entries.async_update_entry(entry, data=data, version=3)
+
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: AmpioConfigEntry) -> bool:
     """Set up a bridge from config entry."""
-    bridge = AmpioBridge(hass, entry)
-    if not await bridge.async_initialize_bridge():
-        return False
-
+    # created first, the bridge diagnostic sensors are attached to it
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
         config_entry_id=entry.entry_id,
@@ -37,13 +51,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: AmpioConfigEntry) -> boo
         model="Ampio",
         name="Ampio CAN Bridge",
     )
-    return True
+
+    bridge = AmpioBridge(hass, entry)
+    return await bridge.async_initialize_bridge()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: AmpioConfigEntry) -> bool:
     """Unload a config entry."""
-    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if entry.runtime_data is None:
+    if (bridge := entry.runtime_data) is None:
         return True
-    return await entry.runtime_data.async_reset()
+
+    await hass.config_entries.async_unload_platforms(entry, bridge.loaded_platforms)
+    return await bridge.async_reset()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: AmpioConfigEntry) -> None:
+    """Remove the cached config of a deleted entry."""
+    if (hash_ := entry.data.get(CONF_CONFIG_HASH)) is not None:
+        await async_remove_config(hass, hash_, entry.entry_id)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import time
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
     AlarmControlPanelEntityDescription,
@@ -13,13 +13,16 @@ from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelState,
     CodeFormat,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
+from homeassistant.helpers.restore_state import RestoreEntity
 
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.alarm_control_panels import AlarmControlPanelsController
     from aioampio.models.alarm_control_panel import AlarmControlPanel
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -36,18 +39,76 @@ async def async_setup_entry(
     controller: AlarmControlPanelsController = api.alarm_control_panels
     make_alarm_entity = partial(AmpioAlarm, bridge, controller)
 
-    @callback
-    def async_add_alarm(event_type: EventType, resource: AlarmControlPanel) -> None:
-        """Add Ampio Alarm Control Panel."""
-        async_add_entities([make_alarm_entity(resource)])
-
     async_add_entities(make_alarm_entity(alarm) for alarm in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_alarm, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_alarm_entity, async_add_entities
     )
 
 
-class AmpioAlarm(AmpioBaseEntity, AlarmControlPanelEntity):
+# zone flags reported by aioampio, bit i of the state mask is FLAGS[i]
+FLAGS = ("armed", "arming", "arming_10s", "breached", "alarm")
+ARMED, ARMING, ARMING_10S, BREACHED, ALARM = (1 << bit for bit in range(len(FLAGS)))
+
+# Satel arm commands, mode 0 is sent by aioampio arm_in_mode0
+SATEL_ARM_MODE1 = 0x81
+SATEL_ARM_MODE2 = 0x82
+
+# seconds within which an armed zone is attributed to a requested mode,
+# covers the exit delay of the zone
+ARM_CONFIRM_TIMEOUT = 120
+
+ARMED_MODES = (
+    AlarmControlPanelState.ARMED_AWAY,
+    AlarmControlPanelState.ARMED_HOME,
+    AlarmControlPanelState.ARMED_NIGHT,
+)
+
+
+async def _async_send_arm(
+    controller: AlarmControlPanelsController,
+    resource_id: str,
+    code: str | None,
+    command: int,
+) -> None:
+    """
+    Send a Satel arm command in any mode.
+
+    aioampio 0.2.3 only exposes arming in mode 0; the other modes go through
+    the private helper behind arm_in_mode0. Revisit when the pin is raised.
+    """
+    await controller._send_alarm_command(resource_id, code, command)  # noqa: SLF001
+
+
+def decode_flags(state: dict[str, Any]) -> int:
+    """Return the bitmask of the zone flags set in an alarm state."""
+    mask = 0
+    for bit, flag in enumerate(FLAGS):
+        if state.get(flag) is True:
+            mask |= 1 << bit
+    return mask
+
+
+def _mask_to_state(mask: int) -> AlarmControlPanelState:
+    """Return the state of a zone, the most severe flag wins."""
+    if mask & ALARM:
+        return AlarmControlPanelState.ALARM_TRIGGERED
+    if mask & BREACHED:
+        return AlarmControlPanelState.PENDING
+    if mask & (ARMING | ARMING_10S):
+        return AlarmControlPanelState.ARMING
+    if mask & ARMED:
+        return AlarmControlPanelState.ARMED_AWAY
+    return AlarmControlPanelState.DISARMED
+
+
+STATE_TABLE = tuple(_mask_to_state(mask) for mask in range(1 << len(FLAGS)))
+ATTRIBUTES_TABLE = tuple(
+    {flag: bool(mask & (1 << bit)) for bit, flag in enumerate(FLAGS)}
+    for mask in range(1 << len(FLAGS))
+)
+
+
+class AmpioAlarm(AmpioBaseEntity, AlarmControlPanelEntity, RestoreEntity):
     """Representation of an Ampio alarm control panel."""
 
     _attr_code_format = CodeFormat.NUMBER
@@ -55,7 +116,11 @@ class AmpioAlarm(AmpioBaseEntity, AlarmControlPanelEntity):
         key="ampio_alarm",
         has_entity_name=False,
     )
-    _attr_supported_features = AlarmControlPanelEntityFeature.ARM_AWAY
+    _attr_supported_features = (
+        AlarmControlPanelEntityFeature.ARM_AWAY
+        | AlarmControlPanelEntityFeature.ARM_HOME
+        | AlarmControlPanelEntityFeature.ARM_NIGHT
+    )
 
     def __init__(
         self,
@@ -66,34 +131,94 @@ class AmpioAlarm(AmpioBaseEntity, AlarmControlPanelEntity):
         """Initialize the Ampio entity."""
         super().__init__(bridge, controller, resource)
         self.name = resource.name
+        self._mask = decode_flags(resource.state)
+        # the zone only reports armed: the mode is the one requested before
+        # the armed flag arrived, None if armed outside Home Assistant
+        self._armed_state: AlarmControlPanelState | None = None
+        self._requested_mode: AlarmControlPanelState | None = None
+        self._requested_at = 0.0
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the arm mode of a zone armed before a restart."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state not in ARMED_MODES:
+            return
+        mode = AlarmControlPanelState(last_state.state)
+        if self._mask & ARMED:
+            self._armed_state = mode
+        else:
+            # the zone state is not known until the gateway reports it, treat
+            # the mode like a request confirmed by an armed report
+            self._requested_mode = mode
+            self._requested_at = time.monotonic()
+
+    def _state_fingerprint(self) -> int:
+        """Return the zone flags bitmask."""
+        return decode_flags(self.resource.state)
+
+    @callback
+    def on_update(self) -> None:
+        """Keep the zone flags written to Home Assistant and the arm mode."""
+        mask = self._last_state
+        if not mask & ARMED:
+            self._armed_state = None
+        elif not self._mask & ARMED:
+            self._armed_state = self._pop_requested_mode()
+        self._mask = mask
+
+    def _pop_requested_mode(self) -> AlarmControlPanelState | None:
+        """Return and clear the mode of a recent arm command."""
+        mode, self._requested_mode = self._requested_mode, None
+        if time.monotonic() - self._requested_at > ARM_CONFIRM_TIMEOUT:
+            return None
+        return mode
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the current alarm control panel entity state."""
-        if self.resource.state is None:
-            return None
-        armed = self.resource.state.get("armed", False)
-        state = AlarmControlPanelState.DISARMED
-
-        if armed is True:
-            state = AlarmControlPanelState.ARMED_AWAY
-        arming = self.resource.state.get("arming", False) or self.resource.state.get(
-            "arming_10s", False
-        )
-        if arming is True:
-            state = AlarmControlPanelState.ARMING
-        breached = self.resource.state.get("breached", False)
-        if breached is True:
-            state = AlarmControlPanelState.PENDING
-        alarm = self.resource.state.get("alarm", False)
-        if alarm is True:
-            state = AlarmControlPanelState.ALARM_TRIGGERED
+        state = STATE_TABLE[self._mask]
+        if state is AlarmControlPanelState.ARMED_AWAY and self._armed_state:
+            # unknown modes are reported as the full arm of mode 0
+            return self._armed_state
         return state
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the zone flags."""
+        return ATTRIBUTES_TABLE[self._mask]
+
+    async def _async_arm(
+        self, code: str | None, mode: AlarmControlPanelState, command: int | None
+    ) -> None:
+        """
+        Send a Satel arm command for the zone, mode 0 if command is None.
+
+        The mode is shown once the zone reports armed, aioampio drops commands
+        with an invalid PIN without raising.
+        """
+        if command is None:
+            await self.controller.arm_in_mode0(self.resource.id, code)
+        else:
+            await _async_send_arm(self.controller, self.resource.id, code, command)
+        self._requested_mode = mode
+        self._requested_at = time.monotonic()
+        self._async_record_command()
+
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
         await self.controller.disarm(self.resource.id, code)
+        self._requested_mode = None
+        self._async_record_command()
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
-        """Send arm away command."""
-        await self.controller.arm_in_mode0(self.resource.id, code)
+        """Send arm away command, Satel arming mode 0."""
+        await self._async_arm(code, AlarmControlPanelState.ARMED_AWAY, None)
+
+    async def async_alarm_arm_home(self, code: str | None = None) -> None:
+        """Send arm home command, Satel arming mode 1."""
+        await self._async_arm(code, AlarmControlPanelState.ARMED_HOME, SATEL_ARM_MODE1)
+
+    async def async_alarm_arm_night(self, code: str | None = None) -> None:
+        """Send arm night command, Satel arming mode 2."""
+        await self._async_arm(code, AlarmControlPanelState.ARMED_NIGHT, SATEL_ARM_MODE2)
@@ -0,0 +1,69 @@
+"""Handling floors and areas for the Ampio integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers.normalized_name_base_registry import normalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from aioampio.models.area import Area
+    from aioampio.models.floor import Floor
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_sync_floors_and_areas(
+    hass: HomeAssistant, floors: Iterable[Floor], areas: Iterable[Area]
+) -> dict[str, str]:
+    """
+    Create or update the floors and areas defined in the config.
+
+    The registries are indexed by normalized name once and only entries that
+    actually differ are written. Returns the normalized name to area id map
+    of all areas known to Home Assistant.
+    """
+    fr_reg = fr.async_get(hass)
+    floor_index = {
+        normalize_name(floor.name): floor for floor in fr_reg.async_list_floors()
+    }
+    for floor in floors:
+        key = normalize_name(floor.name)
+        entry = floor_index.get(key)
+        if entry is None:
+            entry = fr_reg.async_create(floor.name, level=floor.level)
+        elif (entry.name, entry.level) != (floor.name, floor.level):
+            entry = fr_reg.async_update(
+                entry.floor_id, name=floor.name, level=floor.level
+            )
+        floor_index[key] = entry
+
+    ar_reg = ar.async_get(hass)
+    area_index = {normalize_name(area.name): area for area in ar_reg.async_list_areas()}
+    for area in areas:
+        floor_id = None
+        if area.floor_name is not None and (
+            floor := floor_index.get(normalize_name(area.floor_name))
+        ):
+            floor_id = floor.floor_id
+
+        key = normalize_name(area.name)
+        entry = area_index.get(key)
+        if entry is None:
+            entry = ar_reg.async_create(area.name, floor_id=floor_id, icon=area.icon)
+        elif (entry.name, entry.floor_id, entry.icon) != (
+            area.name,
+            floor_id,
+            area.icon,
+        ):
+            entry = ar_reg.async_update(
+                entry.id, name=area.name, floor_id=floor_id, icon=area.icon
+            )
+        area_index[key] = entry
+
+    return {key: entry.id for key, entry in area_index.items()}
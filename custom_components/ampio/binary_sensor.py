@@ -5,18 +5,18 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.core import HomeAssistant, callback
 
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.binary_sensor import BinarySensorsController
     from aioampio.models.binary_sensor import BinarySensor
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -33,16 +33,9 @@ async def async_setup_entry(
     controller: BinarySensorsController = api.binary_sensors
     make_binary_sensor_entity = partial(AmpioBinarySensor, bridge, controller)
 
-    @callback
-    def async_add_binary_sensor(event_type: EventType, resource: BinarySensor) -> None:
-        """Add Ampio Binary Sensor."""
-        async_add_entities([make_binary_sensor_entity(resource)])
-
     async_add_entities(make_binary_sensor_entity(sensor) for sensor in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(
-            async_add_binary_sensor, event_filter=EventType.RESOURCE_ADDED
-        )
+    async_setup_discovery(
+        hass, config_entry, controller, make_binary_sensor_entity, async_add_entities
     )
 
 
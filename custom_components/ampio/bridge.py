@@ -4,31 +4,78 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, suppress
+from dataclasses import asdict
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
 from aioampio import AmpioBridge as AmpioCanBridge
+from aioampio.config import AmpioConfig
+from aioampio.controllers.events import EventType
+from aioampio.models.resource import ResourceTypes
 from homeassistant import core
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.helpers import area_registry as ar
-from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.normalized_name_base_registry import normalize_name
 
-from .const import CONF_CONFIG, CONF_CONFIG_URL
+from .area import async_sync_floors_and_areas
+from .coalescer import StateWriteCoalescer
+from .const import (
+    CONF_CONFIG_HASH,
+    CONF_CONFIG_URL,
+    CONF_FLUSH_WINDOW,
+    CONF_METRICS,
+    CONF_REFRESH_INTERVAL,
+    DOMAIN,
+    PLATFORMS,
+)
 from .device import async_setup_devices
+from .diff import ConfigDiff, diff_config
+from .loader import (
+    ConfigDownloadError,
+    ConfigParseError,
+    async_download_config,
+    parse_config,
+)
+from .metrics import LatencyHistogram, MetricsRegistry, RateCounter
+from .storage import (
+    async_load_config,
+    async_remove_config,
+    async_save_config,
+    config_hash,
+    content_hash,
+)
+from .supervisor import ConnectionSupervisor
 
-PLATFORMS = [
-    Platform.LIGHT,
-    Platform.ALARM_CONTROL_PANEL,
-    Platform.TEXT,
-    Platform.BINARY_SENSOR,
-    Platform.SENSOR,
-    Platform.SWITCH,
-    Platform.COVER,
-    Platform.VALVE,
-    Platform.CLIMATE,
-    # Platform.BUTTON,
-    # Platform.EVENT,
-]
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+
+    from aioampio.controllers.base import AmpioResourceController
+    from caneth import CANFrame
+
+    from .capture import FrameRecorder
+    from .entity import AmpioBaseEntity
+
+# attribute of the aioampio bridge holding the controller of a resource type
+RESOURCE_CONTROLLERS = {
+    ResourceTypes.DEVICE: "devices",
+    ResourceTypes.LIGHT: "lights",
+    ResourceTypes.ALARM_CONTROL_PANEL: "alarm_control_panels",
+    ResourceTypes.TEXT: "texts",
+    ResourceTypes.BINARY_SENSOR: "binary_sensors",
+    ResourceTypes.SENSOR: "sensors",
+    ResourceTypes.SWITCH: "switches",
+    ResourceTypes.COVER: "covers",
+    ResourceTypes.VALVE: "valves",
+    ResourceTypes.CLIMATE: "climates",
+}
 
 type AmpioConfigEntry = ConfigEntry[AmpioBridge]
 
@@ -44,11 +91,79 @@ class AmpioBridge:
         self.config_entry = config_entry
         self.logger = logging.getLogger(__name__)
 
-        self.api = AmpioCanBridge(self.ampio_config, self.host, self.port)
+        self._ampio_config: dict[str, Any] | None = None
+        self._loaded_hash: str | None = None
+        # config applied after the aioampio bridge was initialized
+        self._parsed_config: AmpioConfig | None = None
+        self.api: AmpioCanBridge | None = None
+
+        self.connected = False
+        self.supervisor = ConnectionSupervisor(self)
+        # duration of the startup phases, in seconds
+        self.startup_timings: dict[str, float] = {}
+        # added/updated/removed counts of the device registry reconciliation
+        self.device_sync: dict[str, int] = {}
+
+        # normalized area name to area id, shared with devices and entities
+        self.area_ids: dict[str, str] = {}
+
+        # platforms set up for this entry, the others load on their first resource
+        self.loaded_platforms: set[Platform] = set()
+
+        # shared by all entities of a CAN module, or of a resource type
+        self._device_infos: dict[str, dr.DeviceInfo] = {}
+        self._loggers: dict[str, logging.Logger] = {}
+
+        # entities by resource id, used to apply config changes in place
+        self.entities: dict[str, AmpioBaseEntity] = {}
+
+        # per-platform state write coalescing, opt-in through the entry options
+        self.coalescers: dict[str, StateWriteCoalescer] = {
+            platform: StateWriteCoalescer(hass, window / 1000)
+            for platform, window in config_entry.options.get(
+                CONF_FLUSH_WINDOW, {}
+            ).items()
+            if window > 0
+        }
+        # per-platform count of state writes dropped as no-ops
+        self.suppressed_writes: Counter[str] = Counter()
+
+        # command to CAN echo latency and unacknowledged commands, by module id
+        self.command_latency: defaultdict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.command_timeouts: Counter[str] = Counter()
+        # per-platform count of set-point commands superseded before sending
+        self.collapsed_commands: Counter[str] = Counter()
+
+        # event, state write and command instrumentation, opt-in
+        self.metrics: MetricsRegistry | None = (
+            MetricsRegistry() if config_entry.options.get(CONF_METRICS) else None
+        )
+
+        # HTTP validators of the last config download
+        self._config_etag: str | None = None
+        self._config_last_modified: str | None = None
+        # hash of the last downloaded body, for servers without validators
+        self._config_content_hash: str | None = None
+
+        # received CAN frames per second, always on for diagnostics
+        self.frame_rate = RateCounter()
+        # recording of the received frames, started by the capture service
+        self.recorder: FrameRecorder | None = None
+
+        # host, port and options can only be applied by a reload
+        self._loaded_settings = self._entry_settings()
 
         self.reset_jobs: list[core.CALLBACK_TYPE] = []
+        # connection and supervision, cancelled on reset
+        self._connect_task: asyncio.Task[None] | None = None
         self.config_entry.runtime_data = self
 
+    def _entry_settings(self) -> tuple[str, int, dict[str, Any]]:
+        """Return the entry settings applied when the bridge is created."""
+        return self.host, self.port, dict(self.config_entry.options)
+
     @property
     def url(self) -> str:
         """Return the config URL of the bridge."""
@@ -59,73 +174,404 @@ class AmpioBridge:
         """Return the host of the bridge."""
         return self.config_entry.data[CONF_HOST]
 
+    @property
+    def config_hash(self) -> str:
+        """Return the content hash of the bridge config."""
+        return self.config_entry.data[CONF_CONFIG_HASH]
+
     @property
     def ampio_config(self) -> dict[str, Any]:
         """Return the config of the bridge."""
-        return self.config_entry.data[CONF_CONFIG]
+        if self._ampio_config is None:
+            msg = "Ampio config not loaded"
+            raise RuntimeError(msg)
+        return self._ampio_config
+
+    async def async_load_config(self) -> dict[str, Any] | None:
+        """Load the bridge config from the storage cache."""
+        if self._ampio_config is None:
+            self._loaded_hash = self.config_hash
+            self._ampio_config = await async_load_config(self.hass, self.config_hash)
+        return self._ampio_config
+
+    def config_summary(self) -> dict[str, int]:
+        """Return the number of configured resources per type."""
+        config = self._parsed_config or (self.api.config if self.api else ())
+        return dict(Counter(item.type.value for item in config))
+
+    def controller(self, resource_type: ResourceTypes) -> AmpioResourceController:
+        """Return the controller managing the given resource type."""
+        return getattr(self.api, RESOURCE_CONTROLLERS[resource_type])
+
+    def device_info(self, device_id: str | None) -> dr.DeviceInfo:
+        """Return the device info of a CAN module, or of the bridge if None."""
+        identifier = device_id or self.config_entry.unique_id
+        if (info := self._device_infos.get(identifier)) is None:
+            info = self._device_infos[identifier] = dr.DeviceInfo(
+                identifiers={(DOMAIN, identifier)}
+            )
+        return info
+
+    def type_logger(self, resource_type: str) -> logging.Logger:
+        """Return the logger of a resource type."""
+        if (logger := self._loggers.get(resource_type)) is None:
+            logger = self._loggers[resource_type] = self.logger.getChild(resource_type)
+        return logger
 
     @property
     def port(self) -> int:
         """Return the port of the bridge."""
         return self.config_entry.data[CONF_PORT]
 
+    @contextmanager
+    def _startup_phase(self, phase: str) -> Iterator[None]:
+        """Record the duration of a startup phase."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.startup_timings[phase] = round(time.monotonic() - start, 3)
+
     async def async_initialize_bridge(self) -> bool:
-        """Initialize the Ampio bridge."""
-        setup_ok = False
+        """
+        Initialize the Ampio bridge.
+
+        Only the local config is processed before the platforms are set up;
+        the gateway connection is established in the background and entities
+        stay unavailable until it is up.
+        """
+        with self._startup_phase("load_config"):
+            config = await self.async_load_config()
+        if config is None:
+            self.logger.error(
+                "Cached Ampio config %s is missing, reconfigure the integration",
+                self.config_hash,
+            )
+            return False
+
+        self.api = AmpioCanBridge(config, self.host, self.port)
         try:
-            async with asyncio.timeout(10):
+            with self._startup_phase("initialize"):
                 await self.api.initialize()
-                await self.api.start()
-            setup_ok = True
-        except TimeoutError:
-            pass
         except Exception:
-            self.logger.exception("Unknown error connecting to Ampio CAN Bridge")
+            self.logger.exception("Error processing the Ampio config")
             return False
-        finally:
-            if not setup_ok and self.api is not None:
-                await self.api.stop()
+        self.api.transport.on_frame(self._on_frame)
+        self._async_subscribe_events()
 
-        await async_setup_devices(self)
-        await self.hass.config_entries.async_forward_entry_setups(
-            self.config_entry, PLATFORMS
+        self._connect_task = self.config_entry.async_create_background_task(
+            self.hass, self._async_connect(), "Ampio CAN Bridge connect"
         )
-        fr_reg = fr.async_get(self.hass)
-        for floor in self.api.floors:
-            f = fr_reg.async_get_floor_by_name(floor.name)
-            if not f:
-                f = fr_reg.async_create(floor.name, level=floor.level)
-            else:
-                fr_reg.async_update(f.floor_id, name=floor.name, level=floor.level)
 
-        ar_reg = ar.async_get(self.hass)
-        for area in self.api.areas:
-            a = ar_reg.async_get_area_by_name(area.name)
-            if area.floor_name is not None:
-                f = fr_reg.async_get_floor_by_name(area.floor_name)
-                fid = f.floor_id
-            else:
-                fid = None
-
-            if not a:
-                a = ar_reg.async_create(area.name, floor_id=fid, icon=area.icon)
-            else:
-                ar_reg.async_update(a.id, name=area.name, floor_id=fid, icon=area.icon)
+        with self._startup_phase("registries"):
+            self._async_sync_floors_and_areas(self.api.floors, self.api.areas)
+            self.device_sync = await async_setup_devices(self)
+        with self._startup_phase("platforms"):
+            self.loaded_platforms = self._platforms_in_use()
+            await self.hass.config_entries.async_forward_entry_setups(
+                self.config_entry, self.loaded_platforms
+            )
+        for platform in PLATFORMS:
+            if platform not in self.loaded_platforms:
+                self.reset_jobs.append(
+                    self.controller(ResourceTypes(platform.value)).subscribe(
+                        self._async_resource_added,
+                        event_filter=EventType.RESOURCE_ADDED,
+                    )
+                )
 
         self.reset_jobs.append(self.config_entry.add_update_listener(_update_listener))
+        if refresh_interval := self.config_entry.options.get(CONF_REFRESH_INTERVAL):
+            self.reset_jobs.append(
+                async_track_time_interval(
+                    self.hass,
+                    self._async_refresh_config,
+                    timedelta(minutes=refresh_interval),
+                    name="Ampio config refresh",
+                    cancel_on_shutdown=True,
+                )
+            )
+        return True
+
+    def _platforms_in_use(self) -> set[Platform]:
+        """Return the platforms with at least one configured resource."""
+        platforms = {
+            platform
+            for platform in PLATFORMS
+            if next(iter(self.controller(ResourceTypes(platform.value))), None)
+            is not None
+        }
+        if self.metrics is not None:
+            # the metric sensors of the bridge
+            platforms.add(Platform.SENSOR)
+        return platforms
+
+    @core.callback
+    def _async_resource_added(self, event_type: EventType, resource: Any) -> None:
+        """Set up the platform of the first resource of a new type."""
+        platform = Platform(resource.type.value)
+        if platform in self.loaded_platforms:
+            return
+        # the platform setup adds all resources of the controller
+        self.loaded_platforms.add(platform)
+        self.logger.debug("Loading platform %s for %s", platform, resource.id)
+        self.config_entry.async_create_task(
+            self.hass,
+            self.hass.config_entries.async_late_forward_entry_setups(
+                self.config_entry, [platform]
+            ),
+            f"Ampio {platform} setup",
+        )
+
+    @core.callback
+    def _async_subscribe_events(self) -> None:
+        """Subscribe once to the updates and deletions of every controller."""
+        for resource_type in RESOURCE_CONTROLLERS:
+            if resource_type == ResourceTypes.DEVICE:
+                continue
+            self.reset_jobs.append(
+                self.controller(resource_type).subscribe(
+                    self._async_dispatch_event,
+                    event_filter=(
+                        EventType.RESOURCE_UPDATED,
+                        EventType.RESOURCE_DELETED,
+                    ),
+                )
+            )
+
+    @core.callback
+    def _async_dispatch_event(self, event_type: EventType, resource: Any) -> None:
+        """Route a controller event to the entity of the resource."""
+        # deleted resources unknown to the controller are passed as dicts
+        resource_id = resource["id"] if isinstance(resource, dict) else resource.id
+        if (entity := self.entities.get(resource_id)) is None:
+            return
+
+        if event_type == EventType.RESOURCE_DELETED:
+            # device-less entities belong to the bridge and are kept
+            if entity.device is not None:
+                er.async_get(self.hass).async_remove(entity.entity_id)
+            return
+
+        entity._handler_event(event_type, resource)  # noqa: SLF001
+
+    def _on_frame(self, frame: CANFrame) -> None:
+        """Count a frame received from the CAN gateway."""
+        self.frame_rate.record()
+        self.supervisor.async_frame_received()
+        if self.recorder is not None:
+            self.recorder.record(frame.to_bytes())
+
+    async def _async_connect(self) -> None:
+        """Connect to the CAN gateway and supervise the connection."""
+        with self._startup_phase("connect"):
+            try:
+                await self.api.start()
+            except TimeoutError:
+                # the transport keeps reconnecting on its own
+                self.logger.warning(
+                    "Ampio CAN Bridge at %s:%s is not reachable yet, retrying",
+                    self.host,
+                    self.port,
+                )
+                await self.api.transport.client.wait_connected()
+            except Exception:
+                self.logger.exception(
+                    "Unknown error connecting to Ampio CAN Bridge, retrying"
+                )
+                if not await self.supervisor.async_reconnect():
+                    return
+
+        self.supervisor.async_set_connected(connected=True)
+        await self.supervisor.async_run()
+
+    async def _async_refresh_config(self, _now: datetime | None = None) -> None:
+        """Poll the config URL and store the config if its content changed."""
+        try:
+            download = await async_download_config(
+                self.hass, self.url, self._config_etag, self._config_last_modified
+            )
+        except ConfigDownloadError as err:
+            self.logger.debug("Config refresh from %s failed: %s", self.url, err)
+            return
+
+        self._config_etag = download.etag
+        self._config_last_modified = download.last_modified
+        if not download.modified:
+            return
+        # an unchanged body is not parsed again
+        body_hash = content_hash(download.content)
+        if body_hash == self._config_content_hash:
+            return
+        self._config_content_hash = body_hash
+
+        try:
+            config = await self.hass.async_add_executor_job(
+                parse_config, download.content
+            )
+        except ConfigParseError as err:
+            self.logger.warning(
+                "Config downloaded from %s is not valid: %s", self.url, err
+            )
+            return
+
+        # hashed like the stored config, formatting-only edits are not stored
+        hash_ = await self.hass.async_add_executor_job(config_hash, config)
+        if hash_ == self.config_hash:
+            return
+
+        old_hash = self.config_hash
+        await async_save_config(self.hass, hash_, config)
+        self.logger.info("Config downloaded from %s changed, reloading", self.url)
+        # the update listener applies the new config
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={**self.config_entry.data, CONF_CONFIG_HASH: hash_},
+        )
+        await async_remove_config(self.hass, old_hash)
+
+    async def async_apply_config_update(self) -> bool:
+        """
+        Apply an updated entry without reloading it.
+
+        Returns False if the change can only be applied by a reload.
+        """
+        if self._entry_settings() != self._loaded_settings:
+            return False
+        if self.config_hash == self._loaded_hash:
+            return True
+
+        new_config = await async_load_config(self.hass, self.config_hash)
+        if new_config is None or any(
+            new_config.get(key) != self.ampio_config.get(key)
+            for key in ("codecs", "outputs")
+        ):
+            return False
+
+        parsed = AmpioConfig(self.api)
+        try:
+            await parsed.initialize(new_config)
+        except Exception:  # noqa: BLE001
+            # let the reload report the invalid config
+            return False
+
+        diff = diff_config(self._parsed_config or self.api.config, parsed)
+        if diff.requires_reload or any(
+            item.id in self.controller(item.type) for item in diff.added
+        ):
+            return False
+
+        await self._async_apply_diff(diff, parsed)
+        self._ampio_config = new_config
+        self._parsed_config = parsed
+        self._loaded_hash = self.config_hash
+        self.logger.info(
+            "Applied config update: %d added, %d removed, %d changed",
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
         return True
 
+    async def _async_apply_diff(self, diff: ConfigDiff, parsed: AmpioConfig) -> None:
+        """Apply a config diff to the running bridge and registries."""
+        dev_reg = dr.async_get(self.hass)
+        ent_reg = er.async_get(self.hass)
+
+        if diff.locations_changed:
+            self._async_sync_floors_and_areas(
+                (item for item in parsed if item.type == ResourceTypes.FLOOR),
+                (item for item in parsed if item.type == ResourceTypes.AREA),
+            )
+
+        for item in diff.removed:
+            if item.type == ResourceTypes.DEVICE:
+                if device := dev_reg.async_get_device(identifiers={(DOMAIN, item.id)}):
+                    dev_reg.async_remove_device(device.id)
+            elif entity_id := ent_reg.async_get_entity_id(
+                item.type.value, DOMAIN, item.id
+            ):
+                ent_reg.async_remove(entity_id)
+
+        for item, fields in diff.changed:
+            resource = self.controller(item.type).get(item.id)
+            for field in fields:
+                setattr(resource, field, getattr(item, field))
+
+            if item.type != ResourceTypes.DEVICE:
+                if entity := self.entities.get(item.id):
+                    entity.async_apply_metadata()
+                continue
+
+            if device := dev_reg.async_get_device(identifiers={(DOMAIN, item.id)}):
+                # an area removed from the config is removed from the device,
+                # an area name not known to the registry keeps the current one
+                area_id = (
+                    self.async_get_area_id(item.area) or device.area_id
+                    if item.area
+                    else None
+                )
+                dev_reg.async_update_device(
+                    device.id,
+                    name=item.name,
+                    sw_version=item.sw_version,
+                    hw_version=item.pcb,
+                    area_id=area_id,
+                )
+
+        for item in diff.added:
+            # aioampio (pinned to 0.2.3) has no public API to add resources at
+            # runtime, feed the controller the same event it uses while loading
+            # the config; revisit when the pin is raised
+            await self.controller(item.type)._handle_event(  # noqa: SLF001
+                EventType.RESOURCE_ADDED, asdict(item)
+            )
+
+    @core.callback
+    def _async_sync_floors_and_areas(
+        self, floors: Iterable[Any], areas: Iterable[Any]
+    ) -> None:
+        """Sync the floors and areas of the config and index the areas."""
+        self.area_ids = async_sync_floors_and_areas(self.hass, floors, areas)
+
+    @core.callback
+    def async_get_area_id(self, name: str | None) -> str | None:
+        """Return the id of the area with the given name."""
+        if not name:
+            return None
+        ar_reg = ar.async_get(self.hass)
+        area_id = self.area_ids.get(normalize_name(name))
+        if area_id is not None and ar_reg.async_get_area(area_id) is not None:
+            return area_id
+        # the area was created or removed after the sync
+        area = ar_reg.async_get_area_by_name(name)
+        return area.id if area else None
+
     async def async_reset(self) -> bool:
         """Reset the bridge connection."""
+        while self.reset_jobs:
+            self.reset_jobs.pop()()
+
+        for coalescer in self.coalescers.values():
+            coalescer.async_shutdown()
+
         if self.api is None:
             return True
 
+        # stop the supervisor first, it would restart the closed client
+        self.supervisor.async_stop()
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._connect_task
         await self.api.stop()
         return True
 
 
 async def _update_listener(hass: core.HomeAssistant, entry: AmpioConfigEntry) -> None:
-    """Handle ConfigEntry options update."""
+    """Handle ConfigEntry update."""
+    if await entry.runtime_data.async_apply_config_update():
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
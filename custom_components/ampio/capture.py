@@ -0,0 +1,162 @@
+"""
+Capture and replay of CAN gateway traffic.
+
+A capture file starts with MAGIC followed by fixed-size records: the time
+since the previous frame in microseconds (uint32, little endian) and the
+frame in the 13-byte Waveshare wire format, exactly as the gateway sends
+it.
+
+This module does not depend on Home Assistant, so the replay gateway can
+be started directly:
+
+    python custom_components/ampio/capture.py capture.bin --speed 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import struct
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MAGIC = b"AMPCAP1\n"
+FRAME_SIZE = 13
+RECORD = struct.Struct(f"<I{FRAME_SIZE}s")
+MAX_DELTA = 0xFFFFFFFF
+
+# frames recorded before a capture stops growing, about 32 MiB
+MAX_FRAMES = 2_000_000
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FrameRecorder:
+    """Record frames in memory, bounded by MAX_FRAMES."""
+
+    def __init__(self, max_frames: int = MAX_FRAMES) -> None:
+        """Initialize an empty recording."""
+        self.max_frames = max_frames
+        self.frames = 0
+        self.dropped = 0
+        self._buffer = bytearray(MAGIC)
+        self._last = time.monotonic()
+
+    def record(self, frame: bytes) -> None:
+        """Append a 13-byte wire frame with the time since the last one."""
+        if self.frames >= self.max_frames:
+            self.dropped += 1
+            return
+        now = time.monotonic()
+        delta = min(MAX_DELTA, int((now - self._last) * 1_000_000))
+        self._last = now
+        self._buffer += RECORD.pack(delta, frame)
+        self.frames += 1
+
+    def save(self, path: Path) -> None:
+        """Write the recording to a file, blocking."""
+        path.write_bytes(self._buffer)
+
+
+def read_capture(path: Path) -> Iterator[tuple[float, bytes]]:
+    """Yield the delay in seconds and wire frame of every record."""
+    content = path.read_bytes()
+    if not content.startswith(MAGIC):
+        msg = f"{path} is not an Ampio capture"
+        raise ValueError(msg)
+    for delta, frame in RECORD.iter_unpack(memoryview(content)[len(MAGIC) :]):
+        yield delta / 1_000_000, frame
+
+
+async def _async_stream(
+    frames: list[tuple[float, bytes]],
+    writer: asyncio.StreamWriter,
+    speed: float,
+) -> None:
+    """Send the frames to a connected client, keeping their relative timing."""
+    start = time.monotonic()
+    due = 0.0
+    for delay, frame in frames:
+        writer.write(frame)
+        if speed:
+            due += delay / speed
+            if (wait := due - (time.monotonic() - start)) > 0:
+                await writer.drain()
+                await asyncio.sleep(wait)
+        elif writer.transport.get_write_buffer_size() > 2**16:
+            await writer.drain()
+    await writer.drain()
+
+    elapsed = time.monotonic() - start
+    _LOGGER.info(
+        "Replayed %d frames in %.3f s (%.0f frames/s)",
+        len(frames),
+        elapsed,
+        len(frames) / elapsed if elapsed else 0,
+    )
+
+
+async def async_serve_replay(
+    path: Path, host: str, port: int, speed: float, *, loop: bool = False
+) -> None:
+    """
+    Act as the CAN gateway and replay a capture to every client.
+
+    A speed of 1 keeps the recorded timing, 10 replays ten times faster and
+    0 sends the frames as fast as the connection allows. Frames sent by the
+    client are read and discarded.
+    """
+    frames = list(read_capture(path))
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = writer.get_extra_info("peername")
+        _LOGGER.info("Client %s connected, replaying %d frames", peer, len(frames))
+        drain = asyncio.create_task(reader.read(-1))
+        try:
+            await _async_stream(frames, writer, speed)
+            while loop and not drain.done():
+                await _async_stream(frames, writer, speed)
+            await drain
+        except ConnectionError:
+            _LOGGER.info("Client %s disconnected", peer)
+        finally:
+            drain.cancel()
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    _LOGGER.info("Replay gateway listening on %s:%d", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """Run the replay gateway from the command line."""
+    parser = argparse.ArgumentParser(description="Replay an Ampio CAN capture.")
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=20001)
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="1 = real time, 0 = max speed"
+    )
+    parser.add_argument("--loop", action="store_true", help="replay continuously")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(
+            async_serve_replay(
+                args.capture, args.host, args.port, args.speed, loop=args.loop
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,20 +5,20 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityDescription,
     ClimateEntityFeature,
 )
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.core import HomeAssistant, callback
 
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.climates import ClimatesController
     from aioampio.models.climate import Climate
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -35,14 +35,9 @@ async def async_setup_entry(
     controller: ClimatesController = api.climates
     make_climate_entity = partial(AmpioClimate, bridge, controller)
 
-    @callback
-    def async_add_climate(event_type: EventType, resource: Climate) -> None:
-        """Add Climate."""
-        async_add_entities([make_climate_entity(resource)])
-
     async_add_entities(make_climate_entity(climate) for climate in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_climate, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_climate_entity, async_add_entities
     )
 
 
@@ -69,6 +64,14 @@ class AmpioClimate(AmpioBaseEntity, ClimateEntity):
             | ClimateEntityFeature.TURN_OFF
         )
 
+    def _state_fingerprint(self) -> tuple[bool | None, float | None, float | None]:
+        """Return the heating and temperature snapshot of the climate."""
+        return (
+            self.resource.heating,
+            self.resource.current_temperature,
+            self.resource.target_temperature,
+        )
+
     @property
     def state(self) -> str | None:
         """Return the current state."""
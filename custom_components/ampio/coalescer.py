@@ -0,0 +1,71 @@
+"""Coalescing of Ampio entity state writes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .entity import AmpioBaseEntity
+
+
+class StateWriteCoalescer:
+    """
+    Batch state writes of a single platform into periodic flush ticks.
+
+    Entities are marked dirty on every update and written once per flush
+    window. The resource objects are updated in place by aioampio, so the
+    write performed on flush always reflects the last received state.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float) -> None:
+        """Initialize the coalescer with a flush window in seconds."""
+        self.hass = hass
+        self.window = window
+        self._dirty: dict[str, AmpioBaseEntity] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+        self.coalesced = 0
+        self.written = 0
+
+    @callback
+    def async_schedule(self, entity: AmpioBaseEntity) -> None:
+        """Mark the entity dirty and schedule a flush if needed."""
+        if entity.resource.id in self._dirty:
+            self.coalesced += 1
+            return
+
+        self._dirty[entity.resource.id] = entity
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.window, self._async_flush
+            )
+
+    @callback
+    def async_discard(self, entity: AmpioBaseEntity) -> None:
+        """Drop a pending write of an entity being removed."""
+        self._dirty.pop(entity.resource.id, None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending flush and drop all dirty entities."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._dirty.clear()
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Write the state of all dirty entities."""
+        self._unsub_flush = None
+        dirty, self._dirty = self._dirty, {}
+        for entity in dirty.values():
+            # unchanged states are dropped by the entity and not counted
+            if entity.async_update_state():
+                self.written += 1
@@ -0,0 +1,116 @@
+"""Collapsing of superseded Ampio set-point commands."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import COMMAND_WINDOW
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+    from datetime import datetime
+    from typing import Any
+
+    from homeassistant.core import CALLBACK_TYPE
+
+    from .bridge import AmpioBridge
+
+    type Command = Callable[[], Coroutine[Any, Any, None]]
+
+
+class CommandQueue:
+    """
+    Per-resource queue sending only the latest target of each set-point.
+
+    The first set-point is sent right away and opens a command window.
+    Set-points received while the window is open replace each other by key
+    (e.g. brightness, position, tilt) and the last one is sent when the
+    window closes. Commands like stop, open or close cut through the queue:
+    they drop the pending set-points, wait for any set-point being sent to
+    be cancelled and are sent immediately after, so a stale set-point never
+    reaches the bus after them.
+    """
+
+    def __init__(self, bridge: AmpioBridge, platform: str, module: str) -> None:
+        """Initialize the queue of a resource of the given platform and module."""
+        self.bridge = bridge
+        self.platform = platform
+        self.module = module
+        self._pending: dict[str, Command] = {}
+        self._unsub_window: CALLBACK_TYPE | None = None
+        # held set-points being sent after the window closed
+        self._send_task: asyncio.Task[None] | None = None
+
+    async def async_set_point(self, key: str, command: Command) -> None:
+        """Send a set-point, or hold it until the command window closes."""
+        if self._unsub_window is None:
+            self._async_open_window()
+            await self._async_run(command)
+            return
+
+        if key in self._pending:
+            self.bridge.collapsed_commands[self.platform] += 1
+        self._pending[key] = command
+
+    async def async_cut_through(self, command: Command) -> None:
+        """Drop the pending set-points and send the command immediately."""
+        self.bridge.collapsed_commands[self.platform] += len(self._pending)
+        self._pending.clear()
+        if (task := self._send_task) is not None and not task.done():
+            task.cancel()
+            await asyncio.wait((task,))
+        await self._async_run(command)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Close the command window and drop the pending set-points."""
+        if self._unsub_window is not None:
+            self._unsub_window()
+            self._unsub_window = None
+        self._pending.clear()
+        if self._send_task is not None:
+            self._send_task.cancel()
+            self._send_task = None
+
+    @callback
+    def _async_open_window(self) -> None:
+        """Start holding set-points for the command window."""
+        self._unsub_window = async_call_later(
+            self.bridge.hass, COMMAND_WINDOW, self._async_window_closed
+        )
+
+    @callback
+    def _async_window_closed(self, _now: datetime) -> None:
+        """Send the latest pending set-points."""
+        self._unsub_window = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        # keep the window open while the held set-points are being sent
+        self._async_open_window()
+        self._send_task = self.bridge.config_entry.async_create_background_task(
+            self.bridge.hass,
+            self._async_send(list(pending.values())),
+            f"ampio {self.platform} set-point",
+        )
+
+    async def _async_send(self, commands: list[Command]) -> None:
+        """Send the held set-points in order."""
+        for command in commands:
+            try:
+                await self._async_run(command)
+            except Exception:
+                self.bridge.logger.exception(
+                    "Error sending %s set-point", self.platform
+                )
+
+    async def _async_run(self, command: Command) -> None:
+        """Send a command and count it in the metrics."""
+        await command()
+        if (metrics := self.bridge.metrics) is not None:
+            metrics.record_command(self.platform, self.module)
@@ -3,18 +3,45 @@
 from __future__ import annotations
 
 import logging
-from http import HTTPStatus
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-import yaml
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryState,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
+from homeassistant.helpers import selector
 from yarl import URL
 
-from .const import CONF_CONFIG, CONF_CONFIG_URL, DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_CONFIG_HASH,
+    CONF_CONFIG_URL,
+    CONF_FLUSH_WINDOW,
+    CONF_METRICS,
+    CONF_OPTIMISTIC,
+    CONF_REFRESH_INTERVAL,
+    CONF_SENSOR_FILTERS,
+    CONF_SILENCE_TIMEOUT,
+    DEFAULT_PORT,
+    DOMAIN,
+    MAX_FLUSH_WINDOW,
+    MAX_REFRESH_INTERVAL,
+    MAX_SILENCE_TIMEOUT,
+    PLATFORMS,
+)
+from .loader import (
+    ConfigDownloadError,
+    ConfigParseError,
+    async_download_config,
+    parse_config,
+)
+from .storage import async_remove_config, async_save_config, config_hash
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,11 +59,19 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ampio."""
 
-    VERSION = 2
+    VERSION = 3
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,  # noqa: ARG004
+    ) -> AmpioOptionsFlow:
+        """Get the options flow for this handler."""
+        return AmpioOptionsFlow()
 
     async def download_and_update_config(
         self, url_str: str
-    ) -> tuple[dict[str, Any], dict[str, str]]:
+    ) -> tuple[dict[str, Any], str, dict[str, str]]:
         """Download and update the configuration from a URL."""
         errors: dict[str, str] = {}
 
@@ -48,30 +83,30 @@ class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
         except Exception:  # noqa: BLE001
             errors[CONF_CONFIG_URL] = "invalid_url"
 
-        content_text: str | None = None
+        content: bytes | None = None
 
         if not errors:
             # 2) Try downloading the YAML (HTTP 200 required)
-            session = async_get_clientsession(self.hass)
             try:
-                async with session.get(url_str, timeout=10) as resp:
-                    if resp.status != HTTPStatus.OK:
-                        errors[CONF_CONFIG_URL] = "cannot_connect"
-                    else:
-                        content_text = await resp.text()
-                        LOGGER.info("Configuration file downloaded from %s", url_str)
-            except TimeoutError:
-                errors[CONF_CONFIG_URL] = "timeout"
-            except Exception:  # noqa: BLE001
-                errors[CONF_CONFIG_URL] = "cannot_connect"
+                download = await async_download_config(self.hass, url_str)
+            except ConfigDownloadError as err:
+                errors[CONF_CONFIG_URL] = err.reason
+            else:
+                content = download.content
+                LOGGER.info("Configuration file downloaded from %s", url_str)
 
         data: dict[str, Any] = {}
-        if not errors:  # and downloaded_hash != local_hash:
+        hash_ = ""
+        if not errors:
             try:
-                data = yaml.safe_load(content_text)
-            except yaml.YAMLError:
-                errors[CONF_CONFIG_URL] = "invalid_yaml"
-        return data, errors
+                # large configs would block the event loop
+                data = await self.hass.async_add_executor_job(parse_config, content)
+            except ConfigParseError as err:
+                LOGGER.warning("Configuration from %s rejected: %s", url_str, err)
+                errors[CONF_CONFIG_URL] = err.reason
+            else:
+                hash_ = await self.hass.async_add_executor_job(config_hash, data)
+        return data, hash_, errors
 
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
@@ -105,9 +140,11 @@ class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
             url_str = user_input[CONF_CONFIG_URL].strip()
 
             # Reuse your validator
-            config, errors = await self.download_and_update_config(url_str)
+            config, hash_, errors = await self.download_and_update_config(url_str)
 
             if not errors:
+                await async_save_config(self.hass, hash_, config)
+                old_hash = entry.data.get(CONF_CONFIG_HASH)
                 # Update entry data (don't touch unique_id here)
                 self.hass.config_entries.async_update_entry(
                     entry,
@@ -116,10 +153,14 @@ class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
                         CONF_HOST: host,
                         CONF_PORT: port,
                         CONF_CONFIG_URL: url_str,
-                        CONF_CONFIG: config,
+                        CONF_CONFIG_HASH: hash_,
                     },
                 )
-                await self.hass.config_entries.async_reload(entry.entry_id)
+                if old_hash is not None and old_hash != hash_:
+                    await async_remove_config(self.hass, old_hash)
+                # a loaded entry applies the update from its update listener
+                if entry.state is not ConfigEntryState.LOADED:
+                    await self.hass.config_entries.async_reload(entry.entry_id)
                 return self.async_abort(reason="reconfigure_successful")
 
         return self.async_show_form(
@@ -137,19 +178,21 @@ class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
             url_str: str = user_input[CONF_CONFIG_URL]
 
             # 1) Download and update config file if needed
-            config, errors = await self.download_and_update_config(url_str)
+            config, hash_, errors = await self.download_and_update_config(url_str)
             if not errors:
                 # Stable unique_id prevents duplicate entries for same endpoint
                 await self.async_set_unique_id(f"{host}:{port}")
                 self._abort_if_unique_id_configured()
 
+                await async_save_config(self.hass, hash_, config)
+
                 return self.async_create_entry(
                     title=f"{host}:{port}",
                     data={
                         CONF_HOST: host,
                         CONF_PORT: port,
                         CONF_CONFIG_URL: url_str,
-                        CONF_CONFIG: config,
+                        CONF_CONFIG_HASH: hash_,
                     },
                 )
 
@@ -158,3 +201,100 @@ class AmpioFlowHandler(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+def validate_flush_window(value: Any) -> dict[str, int]:
+    """Validate a platform to flush window (ms) mapping."""
+    if not isinstance(value, dict):
+        msg = "flush window must be a mapping"
+        raise vol.Invalid(msg)
+
+    platforms = {str(platform) for platform in PLATFORMS}
+    windows: dict[str, int] = {}
+    for platform, window in value.items():
+        if platform not in platforms:
+            msg = f"unknown platform: {platform}"
+            raise vol.Invalid(msg)
+        windows[platform] = vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=MAX_FLUSH_WINDOW)
+        )(window)
+    return windows
+
+
+SENSOR_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.Optional("deadband"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("relative_deadband"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional("min_interval"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("heartbeat"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+# keyed by sensor resource id or device class
+validate_sensor_filters = vol.Schema({cv.string: SENSOR_FILTER_SCHEMA})
+
+OPTIONS_VALIDATORS = {
+    CONF_FLUSH_WINDOW: (validate_flush_window, "invalid_flush_window"),
+    CONF_SENSOR_FILTERS: (validate_sensor_filters, "invalid_sensor_filters"),
+}
+
+
+class AmpioOptionsFlow(OptionsFlow):
+    """Handle Ampio options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the Ampio options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            for key, (validator, error) in OPTIONS_VALIDATORS.items():
+                try:
+                    user_input[key] = validator(user_input.get(key, {}))
+                except vol.Invalid:
+                    errors[key] = error
+            if not errors:
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_FLUSH_WINDOW, default=options.get(CONF_FLUSH_WINDOW, {})
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_SENSOR_FILTERS, default=options.get(CONF_SENSOR_FILTERS, {})
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_REFRESH_INTERVAL,
+                    default=options.get(CONF_REFRESH_INTERVAL, 0),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=MAX_REFRESH_INTERVAL,
+                        unit_of_measurement="min",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_SILENCE_TIMEOUT,
+                    default=options.get(CONF_SILENCE_TIMEOUT, 0),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=MAX_SILENCE_TIMEOUT,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_OPTIMISTIC, default=options.get(CONF_OPTIMISTIC, False)
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_METRICS, default=options.get(CONF_METRICS, False)
+                ): selector.BooleanSelector(),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
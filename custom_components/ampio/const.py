@@ -1,6 +1,49 @@
 """Constants for the Ampio integration."""
 
+from homeassistant.const import Platform
+
 DOMAIN = "ampio"
 CONF_CONFIG = "ampio_config"
 CONF_CONFIG_URL = "config_url"
+CONF_CONFIG_HASH = "config_hash"
+CONF_FLUSH_WINDOW = "flush_window"
+CONF_SENSOR_FILTERS = "sensor_filters"
+CONF_REFRESH_INTERVAL = "refresh_interval"
+CONF_OPTIMISTIC = "optimistic"
+CONF_METRICS = "metrics"
+CONF_SILENCE_TIMEOUT = "silence_timeout"
 DEFAULT_PORT = 20001
+
+PLATFORMS = [
+    Platform.LIGHT,
+    Platform.ALARM_CONTROL_PANEL,
+    Platform.TEXT,
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.COVER,
+    Platform.VALVE,
+    Platform.CLIMATE,
+    # Platform.BUTTON,
+    # Platform.EVENT,
+]
+
+# Window in seconds for batching entities of resources added at runtime
+DISCOVERY_WINDOW = 0.1
+
+# Upper bound for the config refresh interval, in minutes
+MAX_REFRESH_INTERVAL = 1440
+
+# Upper bound for the bus silence timeout, in seconds
+MAX_SILENCE_TIMEOUT = 3600
+
+# Upper bound for a per-platform state flush window, in milliseconds
+MAX_FLUSH_WINDOW = 1000
+
+# Seconds to wait for the CAN echo of a command before rolling back an
+# optimistic state
+COMMAND_ACK_TIMEOUT = 3.0
+
+# Seconds during which superseded set-point commands of a resource are
+# collapsed into the latest one
+COMMAND_WINDOW = 0.25
@@ -5,7 +5,6 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
@@ -15,13 +14,16 @@ from homeassistant.components.cover import (
     CoverEntityDescription,
     CoverEntityFeature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
 
+from .commands import CommandQueue
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.covers import CoversController
     from aioampio.models.cover import Cover
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -38,14 +40,9 @@ async def async_setup_entry(
     controller: CoversController = api.covers
     make_cover_entity = partial(AmpioCover, bridge, controller)
 
-    @callback
-    def async_add_cover(event_type: EventType, resource: Cover) -> None:
-        """Add Ampio Cover."""
-        async_add_entities([make_cover_entity(resource)])
-
     async_add_entities(make_cover_entity(cover) for cover in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_cover, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_cover_entity, async_add_entities
     )
 
 
@@ -63,6 +60,7 @@ class AmpioCover(AmpioBaseEntity, CoverEntity):
         """Initialize the Ampio Cover."""
         super().__init__(bridge, controller, resource)
         self.name = resource.name
+        self._commands = CommandQueue(bridge, Platform.COVER, self.module_id)
         self._attr_device_class = resource.device_class
         self._attr_supported_features = (
             CoverEntityFeature.OPEN
@@ -74,6 +72,14 @@ class AmpioCover(AmpioBaseEntity, CoverEntity):
             | CoverEntityFeature.SET_TILT_POSITION
         )
 
+    def _state_fingerprint(self) -> tuple[str | None, int | None, int | None]:
+        """Return the state and position/tilt snapshot of the cover."""
+        return (
+            self.resource.state,
+            self.resource.cover.position,
+            self.resource.tilt.position,
+        )
+
     @property
     def state(self) -> str:
         """Return the state of the cover."""
@@ -93,38 +99,58 @@ class AmpioCover(AmpioBaseEntity, CoverEntity):
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self.controller.open_cover(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.open_cover, self.resource.id)
+        )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        await self.controller.close_cover(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.close_cover, self.resource.id)
+        )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        await self.controller.stop_cover(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.stop_cover, self.resource.id)
+        )
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover position."""
-        await self.controller.set_position(
-            self.resource.id,
-            position=kwargs.get(ATTR_POSITION),
+        await self._commands.async_set_point(
+            "position",
+            partial(
+                self.controller.set_position,
+                self.resource.id,
+                position=kwargs.get(ATTR_POSITION),
+            ),
         )
 
     async def async_open_cover_tilt(self, **kwargs: Any) -> None:
         """Open the cover tilt."""
-        await self.controller.open_tilt(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.open_tilt, self.resource.id)
+        )
 
     async def async_close_cover_tilt(self, **kwargs: Any) -> None:
         """Close the cover tilt."""
-        await self.controller.close_tilt(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.close_tilt, self.resource.id)
+        )
 
     async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
         """Stop the cover tilt."""
-        await self.controller.stop_tilt(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.stop_tilt, self.resource.id)
+        )
 
     async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
         """Set the cover tilt position."""
-        await self.controller.set_position(
-            self.resource.id,
-            tilt_position=kwargs.get(ATTR_TILT_POSITION),
+        await self._commands.async_set_point(
+            "tilt",
+            partial(
+                self.controller.set_position,
+                self.resource.id,
+                tilt_position=kwargs.get(ATTR_TILT_POSITION),
+            ),
         )
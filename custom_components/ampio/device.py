@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from aioampio.controllers.events import EventType
 from homeassistant.core import callback
-from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 
 from .const import DOMAIN
@@ -16,70 +15,110 @@ if TYPE_CHECKING:
     from aioampio.models.device import Device
     from homeassistant.helpers.device_registry import DeviceEntry
 
-    from custom_components.ampio.entity import AmpioResource
-
     AmpioDevice = "AmpioDevice"
 
 
-async def async_setup_devices(bridge: AmpioBridge) -> None:
-    """Manage setup of devices from Ampio Bridge."""
+def _device_params(ampio_resource: Device) -> dict[str, Any]:
+    """Return the device registry fields of an Ampio device."""
+    return {
+        "name": f"{ampio_resource.name}",
+        "manufacturer": "Ampio",
+        "model": ampio_resource.model.name,
+        "model_id": ampio_resource.model.value,
+        "sw_version": ampio_resource.sw_version,
+        "hw_version": ampio_resource.pcb,
+        "serial_number": f"{ampio_resource.can_id:08X}",
+    }
+
+
+async def async_setup_devices(bridge: AmpioBridge) -> dict[str, int]:
+    """
+    Manage setup of devices from Ampio Bridge.
+
+    Registered devices are reconciled by identifier: unchanged devices are
+    skipped, changed ones get only the differing fields updated and devices
+    no longer in the config are removed. Returns the reconciliation counts.
+    """
     entry = bridge.config_entry
     hass = bridge.hass
     dev_reg = dr.async_get(hass)
-    ar_reg = ar.async_get(hass)
     dev_controller = bridge.api.devices
+    stats = {"added": 0, "updated": 0, "removed": 0}
+
+    registered: dict[tuple[str, str], DeviceEntry] = {
+        identifier: device
+        for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id)
+        for identifier in device.identifiers
+        if identifier[0] == DOMAIN
+    }
 
     @callback
-    def add_device(ampio_resource: AmpioResource) -> DeviceEntry:
-        """Register Ampio Device in device registry."""
-        params = {
-            "identifiers": {(DOMAIN, ampio_resource.id)},
-            "name": f"{ampio_resource.name}",
-            "manufacturer": "Ampio",
-            "model": ampio_resource.model.name,
-            "model_id": ampio_resource.model.value,
-            "sw_version": ampio_resource.sw_version,
-            "hw_version": ampio_resource.pcb,
-            "serial_number": f"{ampio_resource.can_id:08X}",
-        }
-
-        device = dev_reg.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            **params,
+    def add_device(ampio_resource: Device) -> None:
+        """Register or update Ampio Device in device registry."""
+        params = _device_params(ampio_resource)
+        area_id = bridge.async_get_area_id(ampio_resource.area)
+        identifier = (DOMAIN, ampio_resource.id)
+
+        device = registered.get(identifier) or dev_reg.async_get_device(
+            identifiers={identifier}
         )
-
-        area = ar_reg.async_get_area_by_name(ampio_resource.area)
-        if area:
-            dev_reg.async_update_device(device.id, area_id=area.id)
-
-        return device
+        if device is None:
+            device = dev_reg.async_get_or_create(
+                config_entry_id=entry.entry_id,
+                identifiers={identifier},
+                **params,
+            )
+            if area_id is not None:
+                device = dev_reg.async_update_device(device.id, area_id=area_id)
+            stats["added"] += 1
+        else:
+            changes = {
+                key: value
+                for key, value in params.items()
+                if getattr(device, key) != value
+            }
+            if area_id is not None and device.area_id != area_id:
+                changes["area_id"] = area_id
+            if changes:
+                device = dev_reg.async_update_device(device.id, **changes)
+                stats["updated"] += 1
+
+        registered[identifier] = device
 
     @callback
     def remove_device(ampio_resource_id: str) -> None:
         """Remove Ampio Device from device registry."""
-        if device := dev_reg.async_get_device(
-            identifiers={(DOMAIN, ampio_resource_id)}
-        ):
+        identifier = (DOMAIN, ampio_resource_id)
+        device = registered.pop(identifier, None) or dev_reg.async_get_device(
+            identifiers={identifier}
+        )
+        if device is not None:
             dev_reg.async_remove_device(device.id)
+            stats["removed"] += 1
 
     @callback
     def handle_device_event(evt_type: EventType, ampio_resource: Device) -> None:
         """Handle events from Ampio devices."""
         if evt_type == EventType.RESOURCE_DELETED:
-            remove_device(ampio_resource.can_id)
+            remove_device(ampio_resource.id)
 
         else:
             add_device(ampio_resource)
 
-    ampio_devices = list(dev_controller)
-    known_devices = [add_device(ampio_device) for ampio_device in ampio_devices]
-    # check for devices that no longr exit and remove them
-    for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
-        if device not in known_devices:
-            dev_reg.async_remove_device(device.id)
-
-    for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
-        if device not in known_devices:
-            dev_reg.async_remove_device(device.id)
-
+    configured = {(DOMAIN, entry.unique_id)}
+    for ampio_device in dev_controller:
+        add_device(ampio_device)
+        configured.add((DOMAIN, ampio_device.id))
+
+    # remove devices that no longer exist in the config
+    for identifier in registered.keys() - configured:
+        remove_device(identifier[1])
+
+    bridge.logger.debug(
+        "Devices reconciled: %d added, %d updated, %d removed",
+        stats["added"],
+        stats["updated"],
+        stats["removed"],
+    )
     entry.async_on_unload(dev_controller.subscribe(handle_device_event))
+    return dict(stats)
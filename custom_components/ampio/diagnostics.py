@@ -0,0 +1,94 @@
+"""Diagnostics support for the Ampio integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+from .const import CONF_CONFIG_URL, CONF_OPTIMISTIC
+from .metrics import percentile, to_ms
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .bridge import AmpioBridge, AmpioConfigEntry
+    from .metrics import MetricsRegistry
+
+TO_REDACT = {CONF_HOST, CONF_CONFIG_URL, "unique_id", "title"}
+
+
+def _connection(bridge: AmpioBridge) -> dict[str, Any]:
+    """Return the state of the CAN gateway connection."""
+    client = bridge.api.transport.client if bridge.api is not None else None
+    supervisor = bridge.supervisor
+    return {
+        "connected": bridge.connected,
+        "connected_since": supervisor.connected_since,
+        "uptime": supervisor.uptime,
+        "disconnects": supervisor.disconnects,
+        "reconnects": supervisor.reconnects,
+        "last_disconnect": supervisor.last_disconnect,
+        "tx_buffer": client.buffer_size() if client is not None else None,
+        "frames": bridge.frame_rate.total,
+        "frame_rate": bridge.frame_rate.rate(),
+    }
+
+
+def _handlers(metrics: MetricsRegistry | None) -> dict[str, Any] | None:
+    """Return the event rates and handler timings, if metrics are enabled."""
+    if metrics is None:
+        return None
+    return {
+        "event_rates": {
+            platform: counter.rate()
+            for platform, counter in metrics.event_rates.items()
+        },
+        "events": dict(metrics.events),
+        "handler_time_ms": {
+            "p50": to_ms(percentile(metrics.handler_time, 0.5), 3),
+            "p95": to_ms(percentile(metrics.handler_time, 0.95), 3),
+            "max": to_ms(max(metrics.handler_time, default=None), 3),
+        },
+        "slowest": [
+            {"entity_id": entity_id, "duration_ms": to_ms(duration, 3)}
+            for duration, entity_id in sorted(metrics.slowest_handlers, reverse=True)
+        ],
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: AmpioConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    bridge = entry.runtime_data
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "config": bridge.config_summary(),
+        "connection": _connection(bridge),
+        "startup": bridge.startup_timings,
+        "platforms": sorted(bridge.loaded_platforms),
+        "device_sync": bridge.device_sync,
+        "handlers": _handlers(bridge.metrics),
+        "state_writes": {
+            "suppressed": dict(bridge.suppressed_writes),
+            "coalescing": {
+                platform: {
+                    "window": coalescer.window,
+                    "coalesced": coalescer.coalesced,
+                    "written": coalescer.written,
+                }
+                for platform, coalescer in bridge.coalescers.items()
+            },
+        },
+        "commands": {
+            "optimistic": entry.options.get(CONF_OPTIMISTIC, False),
+            "latency": {
+                module: histogram.as_dict()
+                for module, histogram in bridge.command_latency.items()
+            },
+            "timeouts": dict(bridge.command_timeouts),
+            "collapsed": dict(bridge.collapsed_commands),
+        },
+    }
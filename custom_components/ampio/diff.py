@@ -0,0 +1,86 @@
+"""Diff of two parsed Ampio configurations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+from aioampio.models.resource import ResourceTypes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# resource fields that can change without re-creating the entity
+METADATA_FIELDS = frozenset({"name", "area"})
+DEVICE_METADATA_FIELDS = frozenset({"name", "area", "sw_version", "pcb"})
+
+LOCATION_TYPES = (ResourceTypes.FLOOR, ResourceTypes.AREA)
+
+
+@dataclass(slots=True)
+class ConfigDiff:
+    """Delta between two Ampio configurations."""
+
+    added: list[Any] = field(default_factory=list)
+    removed: list[Any] = field(default_factory=list)
+    changed: list[tuple[Any, frozenset[str]]] = field(default_factory=list)
+    locations_changed: bool = False
+    requires_reload: bool = False
+
+    def __bool__(self) -> bool:
+        """Return True if there is anything to apply."""
+        return bool(
+            self.added or self.removed or self.changed or self.locations_changed
+        )
+
+
+def diff_config(old: Iterable[Any], new: Iterable[Any]) -> ConfigDiff:
+    """
+    Compare the resources of two configurations by id.
+
+    Changes limited to metadata fields are reported as changed. Any other
+    change, as well as new devices (their CAN ids are not in the bridge
+    filters yet), can only be applied by reloading the entry.
+    """
+    old_items = {item.id: item for item in old}
+    new_items = {item.id: item for item in new}
+    diff = ConfigDiff()
+
+    for item_id, item in new_items.items():
+        prev = old_items.get(item_id)
+        if item.type in LOCATION_TYPES:
+            diff.locations_changed |= prev != item
+            continue
+
+        if prev is None:
+            diff.requires_reload |= item.type == ResourceTypes.DEVICE
+            diff.added.append(item)
+            continue
+
+        if prev == item:
+            continue
+
+        changed = frozenset(
+            f.name
+            for f in fields(item)
+            if getattr(prev, f.name) != getattr(item, f.name)
+        )
+        allowed = (
+            DEVICE_METADATA_FIELDS
+            if item.type == ResourceTypes.DEVICE
+            else METADATA_FIELDS
+        )
+        if changed <= allowed:
+            diff.changed.append((item, changed))
+        else:
+            diff.requires_reload = True
+
+    for item_id, item in old_items.items():
+        if item_id in new_items:
+            continue
+        if item.type in LOCATION_TYPES:
+            diff.locations_changed = True
+        else:
+            diff.removed.append(item)
+
+    return diff
@@ -0,0 +1,83 @@
+"""Batched entity creation for resources announced at runtime."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aioampio.controllers.events import EventType
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DISCOVERY_WINDOW
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from aioampio.controllers.base import AmpioResourceController
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+    from .bridge import AmpioConfigEntry
+
+
+class DiscoveryBuffer:
+    """Collect RESOURCE_ADDED events and add their entities in one batch."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        make_entity: Callable[[Any], Entity],
+        async_add_entities: AddConfigEntryEntitiesCallback,
+        window: float = DISCOVERY_WINDOW,
+    ) -> None:
+        """Initialize the discovery buffer."""
+        self.hass = hass
+        self.window = window
+        self._make_entity = make_entity
+        self._async_add_entities = async_add_entities
+        self._pending: dict[str, Any] = {}
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, event_type: EventType, resource: Any) -> None:
+        """Buffer an added resource."""
+        self._pending[resource.id] = resource
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.window, self._async_flush
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending batch."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._pending.clear()
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Add the entities of all buffered resources."""
+        self._unsub_flush = None
+        pending, self._pending = self._pending, {}
+        self._async_add_entities(
+            [self._make_entity(resource) for resource in pending.values()]
+        )
+
+
+@callback
+def async_setup_discovery(
+    hass: HomeAssistant,
+    config_entry: AmpioConfigEntry,
+    controller: AmpioResourceController,
+    make_entity: Callable[[Any], Entity],
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Add entities of resources announced after the platform setup."""
+    discovery = DiscoveryBuffer(hass, make_entity, async_add_entities)
+    config_entry.async_on_unload(discovery.async_shutdown)
+    config_entry.async_on_unload(
+        controller.subscribe(discovery.async_add, event_filter=EventType.RESOURCE_ADDED)
+    )
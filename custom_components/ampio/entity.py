@@ -2,28 +2,43 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.core import callback
-from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import COMMAND_ACK_TIMEOUT, CONF_OPTIMISTIC, DOMAIN
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from datetime import datetime
+
     from aioampio.controllers.base import AmpioResourceController
+    from aioampio.controllers.events import EventType
     from aioampio.models.alarm_control_panel import AlarmControlPanel
     from aioampio.models.light import Light
     from aioampio.models.text import Text
+    from homeassistant.core import CALLBACK_TYPE
 
     from .bridge import AmpioBridge
+    from .commands import CommandQueue
 
     type AmpioResource = Light | AlarmControlPanel | Text
 
 
+@dataclass(slots=True)
+class PendingCommand:
+    """Command sent to the CAN bus and not yet acknowledged by its echo."""
+
+    expected: dict[str, Any]
+    sent_at: float
+    unsub_timeout: CALLBACK_TYPE
+
+
 class AmpioBaseEntity(Entity):
     """Base class for all Ampio entities."""
 
@@ -40,36 +55,172 @@ class AmpioBaseEntity(Entity):
         self.controller = controller
         self.resource = resource
         self.device = controller.get_device(resource.id)
-        self.logger = bridge.logger.getChild(resource.type.value)
+        self.logger = bridge.type_logger(resource.type.value)
 
         # Entity class attributes
         self._attr_unique_id = resource.id
-        if self.device is None:
-            # attach all device-less entities to the bridge itself
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, bridge.api.config.device.id)},
-            )
-        else:
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, self.device.id)},
-            )
+        # device-less entities are attached to the bridge itself
+        self._attr_device_info = bridge.device_info(
+            self.device.id if self.device is not None else None
+        )
         self._last_state = None
+        self._coalescer = bridge.coalescers.get(resource.type.value)
+
+        self._optimistic: bool = bridge.config_entry.options.get(CONF_OPTIMISTIC, False)
+        self._pending: PendingCommand | None = None
+        # set-point command queue of platforms with sliders
+        self._commands: CommandQueue | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True if the CAN gateway is connected."""
+        return self.bridge.connected
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which was added to hass."""
-        if self.resource.area:
-            area = ar.async_get(self.hass).async_get_area_by_name(self.resource.area)
-            if area:
-                er_reg = er.async_get(self.hass)
-                er_reg.async_update_entity(self.entity_id, area_id=area.id)
-
-        self.async_on_remove(
-            self.controller.subscribe(
-                self._handler_event,
-                self.resource.id,
-                (EventType.RESOURCE_UPDATED, EventType.RESOURCE_DELETED),
-            )
+        self._last_state = self._state_fingerprint()
+        self.on_update()
+        self._async_update_area()
+
+        self.bridge.entities[self.resource.id] = self
+        # controller events are routed to the entity by the bridge
+        self.async_on_remove(lambda: self.bridge.entities.pop(self.resource.id, None))
+
+    @callback
+    def _async_update_area(self, *, clear: bool = False) -> None:
+        """
+        Assign the entity to the area of the resource.
+
+        A resource without an area leaves the entity area alone, unless clear
+        is set because the area was removed from the config.
+        """
+        area_id = self.bridge.async_get_area_id(self.resource.area)
+        if area_id is None and not (clear and not self.resource.area):
+            return
+        if self.registry_entry is None or self.registry_entry.area_id != area_id:
+            er_reg = er.async_get(self.hass)
+            er_reg.async_update_entity(self.entity_id, area_id=area_id)
+
+    @callback
+    def async_apply_metadata(self) -> None:
+        """Apply a changed name or area of the resource."""
+        self.name = self.resource.name
+        self._async_update_area(clear=True)
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Handle entity being removed from hass."""
+        if self._coalescer is not None:
+            self._coalescer.async_discard(self)
+        if self._commands is not None:
+            self._commands.async_shutdown()
+        if self._pending is not None:
+            self._pending.unsub_timeout()
+            self._pending = None
+
+    @property
+    def module_id(self) -> str:
+        """Return the id of the CAN module handling the resource."""
+        return self.device.id if self.device is not None else DOMAIN
+
+    def _confirmed_state(self) -> dict[str, Any]:
+        """Return the last state reported on the CAN bus, by command key."""
+        # used in subclasses accepting optimistic commands
+        return {}
+
+    def _expected_value(self, key: str, confirmed: Any) -> Any:
+        """Return the optimistic value of a state key, or the confirmed one."""
+        if self._optimistic and self._pending is not None:
+            return self._pending.expected.get(key, confirmed)
+        return confirmed
+
+    @callback
+    def _async_record_command(self) -> None:
+        """Count a command sent outside of a command queue."""
+        if (metrics := self.bridge.metrics) is not None:
+            metrics.record_command(self.resource.type.value, self.module_id)
+
+    async def _async_send_tracked(
+        self, expected: dict[str, Any], command: Coroutine[Any, Any, None]
+    ) -> None:
+        """
+        Send a command and track it until the CAN bus reports the expected state.
+
+        The command is tracked before it is sent, so an echo arriving while
+        the send is still in progress acknowledges it. A failed send is
+        dropped and the error raised.
+        """
+        pending = self._async_track_command(expected)
+        try:
+            await command
+        except Exception:
+            if self._pending is pending:
+                self._async_drop_command()
+            raise
+
+    @callback
+    def _async_track_command(self, expected: dict[str, Any]) -> PendingCommand:
+        """
+        Track a command until the CAN bus reports the expected state.
+
+        In optimistic mode the expected state is shown right away and rolled
+        back if the echo does not arrive in time. The command to echo latency
+        is recorded per module either way.
+        """
+        if self._pending is not None:
+            self._pending.unsub_timeout()
+        pending = self._pending = PendingCommand(
+            expected,
+            time.monotonic(),
+            async_call_later(self.hass, COMMAND_ACK_TIMEOUT, self._async_ack_timeout),
         )
+        if self._optimistic:
+            self.async_write_ha_state()
+        return pending
+
+    @callback
+    def _async_drop_command(self) -> None:
+        """Stop tracking a command that was not sent."""
+        if self._pending is None:
+            return
+        self._pending.unsub_timeout()
+        self._pending = None
+        if self._optimistic:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_check_ack(self) -> None:
+        """Resolve the pending command if the resource reached its state."""
+        pending = self._pending
+        if pending is None:
+            return
+        confirmed = self._confirmed_state()
+        if any(confirmed.get(key) != value for key, value in pending.expected.items()):
+            return
+
+        pending.unsub_timeout()
+        self._pending = None
+        latency = time.monotonic() - pending.sent_at
+        self.bridge.command_latency[self.module_id].record(latency)
+        if (metrics := self.bridge.metrics) is not None:
+            metrics.command_latency.append(latency)
+
+    @callback
+    def _async_ack_timeout(self, _now: datetime) -> None:
+        """Drop an unacknowledged command and show the confirmed state."""
+        self._pending = None
+        self.bridge.command_timeouts[self.module_id] += 1
+        self.logger.debug("No acknowledgement of command for %s", self.entity_id)
+        if self._optimistic:
+            self.async_write_ha_state()
+
+    def _state_fingerprint(self) -> Any:
+        """Return a cheap, comparable snapshot of the HA-visible state."""
+        # resources are updated in place, so dict states need to be copied
+        state = self.resource.state
+        if isinstance(state, dict):
+            return tuple(state.items())
+        return state
 
     @callback
     def on_update(self) -> None:
@@ -78,12 +229,49 @@ class AmpioBaseEntity(Entity):
 
     @callback
     def _handler_event(self, event_type: EventType, resource: AmpioResource) -> None:
-        """Handle events from the controller."""
-        if event_type == EventType.RESOURCE_DELETED:
-            if self.device is not None and resource.id == self.resource.id:
-                ent_reg = er.async_get(self.hass)
-                ent_reg.async_remove(self.entity_id)
+        """Handle an update of the resource routed by the bridge."""
+        if (metrics := self.bridge.metrics) is None:
+            self._async_process_event(event_type, resource)
+            return
+
+        start = time.perf_counter()
+        self._async_process_event(event_type, resource)
+        metrics.record_event(
+            self.resource.type.value,
+            self.module_id,
+            self.entity_id,
+            time.perf_counter() - start,
+        )
+
+    @callback
+    def _async_process_event(
+        self, event_type: EventType, resource: AmpioResource
+    ) -> None:
+        """Apply a resource update to the entity."""
+        if self._pending is not None:
+            self._async_check_ack()
+
+        if self._coalescer is not None:
+            self._coalescer.async_schedule(self)
             return
 
+        self.async_update_state()
+
+    @callback
+    def async_update_state(self, *, force: bool = False) -> bool:
+        """
+        Refresh derived state and write it to Home Assistant.
+
+        Returns False if the write was dropped or held back.
+        """
+        fingerprint = self._state_fingerprint()
+        if not force and fingerprint == self._last_state:
+            self.bridge.suppressed_writes[self.resource.type.value] += 1
+            return False
+
+        self._last_state = fingerprint
         self.on_update()
         self.async_write_ha_state()
+        if (metrics := self.bridge.metrics) is not None:
+            metrics.state_writes[self.resource.type.value] += 1
+        return True
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.light import (
     ColorMode,
     LightEntity,
@@ -13,13 +13,16 @@ from homeassistant.components.light import (
     filter_supported_color_modes,
 )
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 
+from .commands import CommandQueue
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.lights import LightsController
     from aioampio.models.light import Light
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -38,21 +41,64 @@ async def async_setup_entry(
     controller: LightsController = api.lights
     make_light_entity = partial(AmpioLight, bridge, controller)
 
-    @callback
-    def async_add_light(event_type: EventType, resource: Light) -> None:
-        """Add Ampio Light."""
-        async_add_entities([make_light_entity(resource)])
-
     async_add_entities(make_light_entity(light) for light in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_light, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_light_entity, async_add_entities
     )
 
 
+# color modes from the least capable, the fallback of a state without values
+COLOR_MODES = (ColorMode.ONOFF, ColorMode.BRIGHTNESS, ColorMode.RGBW)
+
+
+def effective_color_mode(
+    color_modes: set[ColorMode],
+    rgbw_color: tuple[int, int, int, int] | None,
+    brightness: int | None,
+) -> ColorMode:
+    """Return the supported color mode matching the values of a state."""
+    if len(color_modes) == 1:
+        return next(iter(color_modes))
+    if rgbw_color is not None and ColorMode.RGBW in color_modes:
+        return ColorMode.RGBW
+    if brightness is not None and ColorMode.BRIGHTNESS in color_modes:
+        return ColorMode.BRIGHTNESS
+    return next(mode for mode in COLOR_MODES if mode in color_modes)
+
+
+@dataclass(frozen=True, slots=True)
+class LightSnapshot:
+    """HA-visible light attributes decoded from a resource state."""
+
+    on: bool = False
+    brightness: int | None = None
+    rgbw_color: tuple[int, int, int, int] | None = None
+    color_mode: ColorMode = ColorMode.ONOFF
+
+    @classmethod
+    def from_state(
+        cls, state: dict[str, Any], color_modes: set[ColorMode]
+    ) -> LightSnapshot:
+        """Decode the state reported by aioampio for the supported color modes."""
+        rgbw = (
+            state.get("red"),
+            state.get("green"),
+            state.get("blue"),
+            state.get("white"),
+        )
+        rgbw_color = None if None in rgbw else rgbw
+        brightness = state.get("brightness")
+        return cls(
+            on=bool(state.get("state")),
+            brightness=brightness,
+            rgbw_color=rgbw_color,
+            color_mode=effective_color_mode(color_modes, rgbw_color, brightness),
+        )
+
+
 class AmpioLight(AmpioBaseEntity, LightEntity):
     """Representation of an Ampio light."""
 
-    _fixed_color_mode: ColorMode | None = None
     entity_description = LightEntityDescription(
         key="ampio_light",
         has_entity_name=False,
@@ -75,41 +121,49 @@ class AmpioLight(AmpioBaseEntity, LightEntity):
 
         supported_color_modes = filter_supported_color_modes(supported_color_modes)
         self._attr_supported_color_modes = supported_color_modes
-        if len(self._attr_supported_color_modes) == 1:
-            # If the light supports only a single color mode, set it now
-            self._fixed_color_mode = next(iter(self._attr_supported_color_modes))
         self._last_brightness: int | None = None
+        self._snapshot = LightSnapshot.from_state(resource.state, supported_color_modes)
+        self._commands = CommandQueue(bridge, Platform.LIGHT, self.module_id)
 
         self.name = resource.name
 
+    def _state_fingerprint(self) -> LightSnapshot:
+        """Return the decoded state, it doubles as the change detection key."""
+        return LightSnapshot.from_state(
+            self.resource.state, self._attr_supported_color_modes
+        )
+
+    @callback
+    def on_update(self) -> None:
+        """Keep the snapshot written to Home Assistant."""
+        self._snapshot = self._last_state
+
     @property
     def brightness(self) -> int | None:
         """Return the brightness of the light."""
-        return self.resource.state.get("brightness") if self.resource.state else None
+        return self._expected_value("brightness", self._snapshot.brightness)
 
     @property
     def is_on(self) -> bool:
         """Return True if the light is on."""
-        if not self.resource.state:
-            return False
-        state = self.resource.state.get("state") if self.resource.state else None
-        return bool(state)
+        return bool(self._expected_value("state", self._snapshot.on))
 
     @property
     def rgbw_color(self) -> tuple[int, int, int, int] | None:
         """Return the RGBW color of the light."""
-        red = self.resource.state.get("red") if self.resource.state else None
-        green = self.resource.state.get("green") if self.resource.state else None
-        blue = self.resource.state.get("blue") if self.resource.state else None
-        white = self.resource.state.get("white") if self.resource.state else None
-        if any(v is None for v in (red, green, blue, white)):
-            return None
-        return red, green, blue, white
+        return self._snapshot.rgbw_color
+
+    def _confirmed_state(self) -> dict[str, Any]:
+        """Return the last state reported on the CAN bus."""
+        return {
+            "state": bool(self.resource.state.get("state")),
+            "brightness": self.resource.state.get("brightness"),
+        }
 
     @property
     def color_mode(self) -> ColorMode:
         """Return the color mode of the light."""
-        return self._fixed_color_mode or ColorMode.ONOFF
+        return self._snapshot.color_mode
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
@@ -122,19 +176,54 @@ class AmpioLight(AmpioBaseEntity, LightEntity):
         if self.resource.color and color is None:
             self._attr_rgbw_color = color
 
-        await self.controller.set_state(
-            id=self.resource.id,
-            on=True,
-            brightness=brightness,
-            color=color,
-        )
+        expected: dict[str, Any] = {"state": color is None or any(color)}
+        if self.resource.dimming and brightness is not None:
+            expected["brightness"] = brightness
+
+        async def send() -> None:
+            await self._async_send_tracked(
+                expected,
+                self.controller.set_state(
+                    id=self.resource.id,
+                    on=True,
+                    brightness=brightness,
+                    color=color,
+                ),
+            )
+
+        # slider moves are collapsed, plain turn on cuts through the queue
+        if color is not None:
+            await self._commands.async_set_point("color", send)
+        elif "brightness" in expected:
+            await self._commands.async_set_point("brightness", send)
+        else:
+            await self._commands.async_cut_through(send)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        if self.resource.dimming:
-            self._last_brightness = self.resource.state.get("brightness")
+        await self.async_send_state(on=False)
 
-        await self.controller.set_state(
-            id=self.resource.id,
-            on=False,
-        )
+    async def async_send_state(
+        self, *, on: bool, brightness: int | None = None
+    ) -> None:
+        """Switch the light, dropping the set-points held for it."""
+        # the level is restored by the next turn on without a brightness
+        if self.resource.dimming:
+            if not on:
+                self._last_brightness = self._snapshot.brightness
+            elif brightness is None and self._last_brightness:
+                brightness, self._last_brightness = self._last_brightness, None
+
+        expected: dict[str, Any] = {"state": on}
+        if on and self.resource.dimming and brightness is not None:
+            expected["brightness"] = brightness
+
+        async def send() -> None:
+            await self._async_send_tracked(
+                expected,
+                self.controller.set_state(
+                    id=self.resource.id, on=on, brightness=brightness
+                ),
+            )
+
+        await self._commands.async_cut_through(send)
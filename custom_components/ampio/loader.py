@@ -0,0 +1,162 @@
+"""Download of the Ampio YAML configuration."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DOWNLOAD_TIMEOUT = 10
+
+# largest accepted configuration file, in bytes
+MAX_CONFIG_SIZE = 4 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class ConfigParseError(HomeAssistantError):
+    """Error parsing or validating the Ampio configuration."""
+
+    def __init__(self, reason: str, details: str) -> None:
+        """Initialize the error with a config flow error key."""
+        super().__init__(details)
+        self.reason = reason
+
+
+class ConfigDownloadError(HomeAssistantError):
+    """Error downloading the Ampio configuration."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialize the error with a config flow error key."""
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(slots=True)
+class ConfigDownload:
+    """Result of a (conditional) configuration download."""
+
+    content: bytes | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def modified(self) -> bool:
+        """Return True if the server sent new content."""
+        return self.content is not None
+
+
+async def async_download_config(
+    hass: HomeAssistant,
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> ConfigDownload:
+    """
+    Download the configuration file.
+
+    When a validator from a previous download is given the request is
+    conditional and a 304 response is returned without content. The body is
+    read in chunks and the download is aborted once it exceeds
+    MAX_CONFIG_SIZE.
+    """
+    headers = {}
+    if etag is not None:
+        headers[hdrs.IF_NONE_MATCH] = etag
+    if last_modified is not None:
+        headers[hdrs.IF_MODIFIED_SINCE] = last_modified
+
+    session = async_get_clientsession(hass)
+    try:
+        async with session.get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT) as resp:
+            status = resp.status
+            content = await _async_read_body(resp) if status == HTTPStatus.OK else None
+            validators = (
+                resp.headers.get(hdrs.ETAG),
+                resp.headers.get(hdrs.LAST_MODIFIED),
+            )
+    except ConfigDownloadError:
+        raise
+    except TimeoutError as err:
+        reason = "timeout"
+        raise ConfigDownloadError(reason) from err
+    except Exception as err:
+        reason = "cannot_connect"
+        raise ConfigDownloadError(reason) from err
+
+    if status == HTTPStatus.NOT_MODIFIED:
+        return ConfigDownload(None, etag, last_modified)
+    if status != HTTPStatus.OK:
+        reason = "cannot_connect"
+        raise ConfigDownloadError(reason)
+    return ConfigDownload(content, *validators)
+
+
+async def _async_read_body(resp: ClientResponse) -> bytes:
+    """Read a response body of at most MAX_CONFIG_SIZE bytes."""
+    if (resp.content_length or 0) > MAX_CONFIG_SIZE:
+        reason = "too_large"
+        raise ConfigDownloadError(reason)
+
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+        body += chunk
+        if len(body) > MAX_CONFIG_SIZE:
+            reason = "too_large"
+            raise ConfigDownloadError(reason)
+    # decoded by the YAML parser, a bad encoding is an invalid config
+    return bytes(body)
+
+
+def parse_config(content: bytes) -> dict[str, Any]:
+    """
+    Parse, validate and normalize the YAML configuration.
+
+    The configuration is validated against the aioampio schema, so an invalid
+    file is rejected before it is stored, and the normalized model is
+    returned: defaults filled in, states lowercased into lists and light
+    features derived from their states. Files differing only in such details
+    therefore hash the same. Raises ConfigParseError. Parsing is CPU bound,
+    large files should be parsed in the executor.
+    """
+    # only needed when a config is downloaded, not on every startup
+    import yaml  # noqa: PLC0415
+    from aioampio.models.config import Config  # noqa: PLC0415
+    from pydantic import ValidationError  # noqa: PLC0415
+
+    # the libyaml loader is an order of magnitude faster, if available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    start = time.perf_counter()
+    try:
+        # the YAML reader detects the encoding, decoding errors are YAML errors
+        config = yaml.load(content, Loader=loader)  # noqa: S506
+    except yaml.YAMLError as err:
+        reason = "invalid_config"
+        raise ConfigParseError(reason, str(err)) from err
+    parsed = time.perf_counter()
+
+    try:
+        model = Config.model_validate(config)
+    except ValidationError as err:
+        reason = "invalid_config"
+        raise ConfigParseError(reason, str(err)) from err
+    normalized = model.model_dump(mode="json")
+
+    _LOGGER.info(
+        "Parsed configuration with %s in %.3f s, validated in %.3f s",
+        loader.__name__,
+        parsed - start,
+        time.perf_counter() - parsed,
+    )
+    return normalized
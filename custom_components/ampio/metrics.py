@@ -0,0 +1,149 @@
+"""Runtime metrics of the Ampio integration."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# upper bounds of the command latency buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0)
+
+# size of the ring buffers holding the most recent timing samples
+METRIC_SAMPLES = 512
+
+# seconds over which event rates are averaged
+RATE_WINDOW = 60
+
+# number of slowest event handlers kept for diagnostics
+SLOWEST_HANDLERS = 10
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies in seconds."""
+
+    __slots__ = ("bounds", "buckets", "count", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a single latency sample."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in milliseconds, for diagnostics."""
+        labels = [f"<={bound * 1000:g}ms" for bound in self.bounds]
+        labels.append("+Inf")
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 1) if self.count else None,
+            "max_ms": round(self.max * 1000, 1),
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class RateCounter:
+    """Events per second over a sliding window of one-second buckets."""
+
+    __slots__ = ("_buckets", "total")
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        """Initialize an empty counter."""
+        self._buckets: deque[list[int]] = deque(maxlen=window)
+        self.total = 0
+
+    def record(self, now: float | None = None) -> None:
+        """Count a single event."""
+        second = int(time.monotonic() if now is None else now)
+        self.total += 1
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += 1
+        else:
+            self._buckets.append([second, 1])
+
+    def rate(self, now: float | None = None) -> float:
+        """Return the average number of events per second in the window."""
+        window = self._buckets.maxlen or 1
+        start = int(time.monotonic() if now is None else now) - window
+        count = sum(n for second, n in self._buckets if second > start)
+        return round(count / window, 2)
+
+
+def to_ms(value: float | None, ndigits: int = 1) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if value is None else round(value * 1000, ndigits)
+
+
+def percentile(samples: Iterable[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of the samples, None if empty."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class MetricsRegistry:
+    """
+    Opt-in counters of the Ampio entities, per platform and CAN module.
+
+    Latency and handler time samples are kept in bounded ring buffers, so
+    the cost of recording stays constant. When metrics are disabled the
+    bridge holds no registry and the entities skip recording altogether.
+    """
+
+    __slots__ = (
+        "command_latency",
+        "commands",
+        "event_rates",
+        "events",
+        "handler_time",
+        "module_commands",
+        "module_events",
+        "slowest_handlers",
+        "state_writes",
+    )
+
+    def __init__(self, samples: int = METRIC_SAMPLES) -> None:
+        """Initialize empty counters and sample buffers."""
+        self.events: Counter[str] = Counter()
+        self.module_events: Counter[str] = Counter()
+        self.state_writes: Counter[str] = Counter()
+        self.commands: Counter[str] = Counter()
+        self.module_commands: Counter[str] = Counter()
+        self.command_latency: deque[float] = deque(maxlen=samples)
+        self.handler_time: deque[float] = deque(maxlen=samples)
+        self.event_rates: defaultdict[str, RateCounter] = defaultdict(RateCounter)
+        # min-heap of (duration, entity id), the fastest is replaced first
+        self.slowest_handlers: list[tuple[float, str]] = []
+
+    def record_event(
+        self, platform: str, module: str, entity_id: str, duration: float
+    ) -> None:
+        """Count a received event and the time spent handling it."""
+        self.events[platform] += 1
+        self.module_events[module] += 1
+        self.event_rates[platform].record()
+        self.handler_time.append(duration)
+        if len(self.slowest_handlers) < SLOWEST_HANDLERS:
+            heapq.heappush(self.slowest_handlers, (duration, entity_id))
+        elif duration > self.slowest_handlers[0][0]:
+            heapq.heapreplace(self.slowest_handlers, (duration, entity_id))
+
+    def record_command(self, platform: str, module: str) -> None:
+        """Count a command sent to the CAN bus."""
+        self.commands[platform] += 1
+        self.module_commands[module] += 1
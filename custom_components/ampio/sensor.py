@@ -2,28 +2,39 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
     StateType,
 )
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
+from .const import CONF_SENSOR_FILTERS
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
+from .metrics import percentile, to_ms
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from datetime import date, datetime
     from decimal import Decimal
 
     from aioampio.controllers.sensor import SensorsController
     from aioampio.models.sensor import Sensor
+    from homeassistant.core import CALLBACK_TYPE
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
+    from .metrics import MetricsRegistry
 
 
 async def async_setup_entry(
@@ -37,17 +48,35 @@ async def async_setup_entry(
     controller: SensorsController = api.sensors
     make_sensor_entity = partial(AmpioSensor, bridge, controller)
 
-    @callback
-    def async_add_sensor(event_type: EventType, resource: Sensor) -> None:
-        """Add Ampio Sensor."""
-        async_add_entities([make_sensor_entity(resource)])
-
     async_add_entities(make_sensor_entity(sensor) for sensor in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_sensor, event_filter=EventType.RESOURCE_ADDED)
+    if bridge.metrics is not None:
+        async_add_entities(
+            AmpioMetricSensor(bridge, bridge.metrics, description)
+            for description in METRIC_SENSORS
+        )
+    async_setup_discovery(
+        hass, config_entry, controller, make_sensor_entity, async_add_entities
     )
 
 
+@dataclass(frozen=True, slots=True)
+class SensorFilter:
+    """Deadband and rate limit applied to sensor readings before publishing."""
+
+    deadband: float = 0.0
+    relative_deadband: float = 0.0
+    min_interval: float = 0.0
+    heartbeat: float = 0.0
+
+    def is_significant(self, old: Any, new: Any) -> bool:
+        """Return True if the change from old to new leaves the deadband."""
+        if not isinstance(old, int | float) or not isinstance(new, int | float):
+            # text, enum and missing readings are published on any change
+            return old != new
+        delta = abs(new - old)
+        return delta >= self.deadband and delta >= self.relative_deadband * abs(old)
+
+
 class AmpioSensor(AmpioBaseEntity, SensorEntity):
     """Representation of an Ampio Sensor."""
 
@@ -65,7 +94,170 @@ class AmpioSensor(AmpioBaseEntity, SensorEntity):
         self._attr_native_unit_of_measurement = resource.unit_of_measurement
         self.name = resource.name
 
+        filters = bridge.config_entry.options.get(CONF_SENSOR_FILTERS, {})
+        filter_cfg = filters.get(resource.id, filters.get(resource.device_class))
+        self._filter = SensorFilter(**filter_cfg) if filter_cfg else None
+        self._published_value = resource.state
+        self._published_at = 0.0
+        self._unsub_pending: CALLBACK_TYPE | None = None
+        self._unsub_heartbeat: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending rate-limited publish and the heartbeat."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_pending is not None:
+            self._unsub_pending()
+            self._unsub_pending = None
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+
+    @callback
+    def async_update_state(self, *, force: bool = False) -> bool:
+        """Apply the deadband and rate limit before writing the state."""
+        if self._filter is None or force:
+            return super().async_update_state(force=force)
+
+        if self._unsub_pending is not None:
+            # the pending publish picks up the latest reading
+            return False
+
+        if not self._filter.is_significant(self._published_value, self.resource.state):
+            # published by the heartbeat, if configured
+            return False
+
+        elapsed = time.monotonic() - self._published_at
+
+        if elapsed < self._filter.min_interval:
+            self._unsub_pending = async_call_later(
+                self.hass, self._filter.min_interval - elapsed, self._async_publish
+            )
+            return False
+
+        return super().async_update_state()
+
+    @callback
+    def _async_publish(self, _now: datetime) -> None:
+        """Publish the reading held back by the rate limit."""
+        self._unsub_pending = None
+        super().async_update_state()
+
+    @callback
+    def _async_heartbeat(self, _now: datetime) -> None:
+        """Republish the latest reading, even if unchanged."""
+        self._unsub_heartbeat = None
+        super().async_update_state(force=True)
+
+    @callback
+    def on_update(self) -> None:
+        """Remember the published reading and restart the heartbeat."""
+        self._published_value = self.resource.state
+        self._published_at = time.monotonic()
+        if self._filter is None or not self._filter.heartbeat:
+            return
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+        self._unsub_heartbeat = async_call_later(
+            self.hass, self._filter.heartbeat, self._async_heartbeat
+        )
+
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-        return self.resource.state
+        return self._published_value
+
+
+@dataclass(frozen=True, kw_only=True)
+class AmpioMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes an Ampio metric sensor."""
+
+    value_fn: Callable[[MetricsRegistry], StateType]
+    attributes_fn: Callable[[MetricsRegistry], dict[str, Any]]
+
+
+METRIC_SENSORS = (
+    AmpioMetricSensorEntityDescription(
+        key="events",
+        translation_key="events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.events.total(),
+        attributes_fn=lambda metrics: {
+            "platforms": dict(metrics.events),
+            "modules": dict(metrics.module_events),
+        },
+    ),
+    AmpioMetricSensorEntityDescription(
+        key="state_writes",
+        translation_key="state_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.state_writes.total(),
+        attributes_fn=lambda metrics: {"platforms": dict(metrics.state_writes)},
+    ),
+    AmpioMetricSensorEntityDescription(
+        key="commands",
+        translation_key="commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.commands.total(),
+        attributes_fn=lambda metrics: {
+            "platforms": dict(metrics.commands),
+            "modules": dict(metrics.module_commands),
+        },
+    ),
+    AmpioMetricSensorEntityDescription(
+        key="command_latency",
+        translation_key="command_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: to_ms(percentile(metrics.command_latency, 0.5)),
+        attributes_fn=lambda metrics: {
+            "p95": to_ms(percentile(metrics.command_latency, 0.95)),
+            "p99": to_ms(percentile(metrics.command_latency, 0.99)),
+            "samples": len(metrics.command_latency),
+        },
+    ),
+    AmpioMetricSensorEntityDescription(
+        key="handler_time",
+        translation_key="handler_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=3,
+        value_fn=lambda metrics: to_ms(percentile(metrics.handler_time, 0.5), 3),
+        attributes_fn=lambda metrics: {
+            "p95": to_ms(percentile(metrics.handler_time, 0.95), 3),
+            "max": to_ms(max(metrics.handler_time, default=None), 3),
+            "samples": len(metrics.handler_time),
+        },
+    ),
+)
+
+
+class AmpioMetricSensor(SensorEntity):
+    """Diagnostic sensor of the Ampio CAN Bridge exposing a metric."""
+
+    entity_description: AmpioMetricSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        bridge: AmpioBridge,
+        metrics: MetricsRegistry,
+        description: AmpioMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        self.entity_description = description
+        self._metrics = metrics
+        self._attr_unique_id = f"{bridge.config_entry.unique_id}_{description.key}"
+        self._attr_device_info = bridge.device_info(None)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per platform or module breakdown of the metric."""
+        return self.entity_description.attributes_fn(self._metrics)
@@ -0,0 +1,216 @@
+"""Services of the Ampio integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_STATE, Platform
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .light import AmpioLight
+    from .switch import AmpioSwitch
+
+    type BulkTarget = AmpioLight | AmpioSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY_SCENE = "apply_scene"
+SERVICE_BULK_SET = "bulk_set"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
+ATTR_BRIGHTNESS = "brightness"
+ATTR_ENTITIES = "entities"
+
+TARGET_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STATE): cv.boolean,
+        vol.Optional(ATTR_BRIGHTNESS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=255)
+        ),
+    }
+)
+
+BULK_SET_SCHEMA = TARGET_STATE_SCHEMA.extend(
+    {vol.Required(ATTR_ENTITY_ID): cv.entity_ids}
+)
+
+APPLY_SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITIES): {
+            cv.entity_id: vol.Any(
+                vol.All(cv.boolean, lambda on: {ATTR_STATE: on}),
+                TARGET_STATE_SCHEMA,
+            )
+        }
+    }
+)
+
+# platforms of the entities accepted by bulk_set and apply_scene
+BULK_PLATFORMS = (Platform.LIGHT, Platform.SWITCH)
+
+
+@callback
+def _async_get_target(hass: HomeAssistant, entity_id: str) -> BulkTarget:
+    """Return the loaded Ampio light or switch of an entity id."""
+    entity = None
+    registry_entry = er.async_get(hass).async_get(entity_id)
+    if (
+        registry_entry is not None
+        and registry_entry.platform == DOMAIN
+        and registry_entry.domain in BULK_PLATFORMS
+    ):
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            if entry.entry_id == registry_entry.config_entry_id:
+                entity = entry.runtime_data.entities.get(registry_entry.unique_id)
+
+    if entity is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="unsupported_entity",
+            translation_placeholders={"entity_id": entity_id},
+        )
+    return entity
+
+
+async def _async_dispatch(
+    hass: HomeAssistant, targets: dict[str, dict[str, Any]]
+) -> ServiceResponse:
+    """
+    Send the target states grouped per CAN module in a single burst.
+
+    All targets are resolved before the first command is sent, so an invalid
+    target does not leave the scene half applied. The commands of a module are
+    sent concurrently; a failing command does not stop the others and all
+    failures are reported in a single error.
+    """
+    modules: defaultdict[str, list[tuple[BulkTarget, dict[str, Any]]]] = defaultdict(
+        list
+    )
+    for entity_id, target in targets.items():
+        entity = _async_get_target(hass, entity_id)
+        modules[entity.module_id].append((entity, target))
+
+    start = time.perf_counter()
+    failed = []
+    for commands in modules.values():
+        results = await asyncio.gather(
+            *(
+                entity.async_send_state(
+                    on=target[ATTR_STATE], brightness=target.get(ATTR_BRIGHTNESS)
+                )
+                for entity, target in commands
+            ),
+            return_exceptions=True,
+        )
+        for (entity, _), result in zip(commands, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error sending command to %s: %s", entity.entity_id, result
+                )
+                failed.append(entity.entity_id)
+    dispatch_time = time.perf_counter() - start
+
+    if failed:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="command_failed",
+            translation_placeholders={"entity_ids": ", ".join(failed)},
+        )
+
+    return {
+        "targets": len(targets),
+        "modules": len(modules),
+        "dispatch_ms": round(dispatch_time * 1000, 1),
+    }
+
+
+async def _async_stop_capture(hass: HomeAssistant) -> ServiceResponse:
+    """Save the recordings of all loaded entries to the config directory."""
+    captures = []
+    timestamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        bridge = entry.runtime_data
+        if (recorder := bridge.recorder) is None:
+            continue
+        bridge.recorder = None
+        path = Path(hass.config.path(f"ampio_capture_{entry.entry_id}_{timestamp}.bin"))
+        await hass.async_add_executor_job(recorder.save, path)
+        captures.append(
+            {"path": str(path), "frames": recorder.frames, "dropped": recorder.dropped}
+        )
+    return {"captures": captures}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Ampio services."""
+
+    async def async_bulk_set(call: ServiceCall) -> ServiceResponse:
+        """Set many lights and switches to the same state."""
+        target = {
+            key: value
+            for key, value in call.data.items()
+            if key in (ATTR_STATE, ATTR_BRIGHTNESS)
+        }
+        return await _async_dispatch(
+            hass, dict.fromkeys(call.data[ATTR_ENTITY_ID], target)
+        )
+
+    async def async_apply_scene(call: ServiceCall) -> ServiceResponse:
+        """Set lights and switches to per-entity states."""
+        return await _async_dispatch(hass, call.data[ATTR_ENTITIES])
+
+    async def async_start_capture(call: ServiceCall) -> None:
+        """Start recording the frames received by all loaded entries."""
+        from .capture import FrameRecorder  # noqa: PLC0415
+
+        entries = hass.config_entries.async_loaded_entries(DOMAIN)
+        # a new recorder would silently drop the frames of the running one
+        if any(entry.runtime_data.recorder is not None for entry in entries):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="capture_running"
+            )
+        for entry in entries:
+            entry.runtime_data.recorder = FrameRecorder()
+
+    async def async_stop_capture(call: ServiceCall) -> ServiceResponse:
+        """Stop recording and save the captures."""
+        return await _async_stop_capture(hass)
+
+    hass.services.async_register(DOMAIN, SERVICE_START_CAPTURE, async_start_capture)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        async_stop_capture,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        async_bulk_set,
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCENE,
+        async_apply_scene,
+        schema=APPLY_SCENE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
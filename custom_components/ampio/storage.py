@@ -0,0 +1,65 @@
+"""Persistent cache of the parsed Ampio configuration."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import CONF_CONFIG_HASH, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.config"
+
+
+def content_hash(content: str | bytes) -> str:
+    """Return the hash identifying a configuration file content."""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """
+    Return the hash identifying a parsed configuration.
+
+    Every stored configuration is keyed by this hash, whether it was
+    downloaded or migrated from an entry, so stored and downloaded
+    configurations compare equal when their content is the same.
+    """
+    return content_hash(json.dumps(config, sort_keys=True, default=str))
+
+
+def _store(hass: HomeAssistant, hash_: str) -> Store[dict[str, Any]]:
+    """Return the store holding the configuration with the given hash."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{hash_}")
+
+
+async def async_save_config(
+    hass: HomeAssistant, hash_: str, config: dict[str, Any]
+) -> None:
+    """Store a parsed configuration under its content hash."""
+    await _store(hass, hash_).async_save(config)
+
+
+async def async_load_config(hass: HomeAssistant, hash_: str) -> dict[str, Any] | None:
+    """Load a parsed configuration by its content hash."""
+    return await _store(hass, hash_).async_load()
+
+
+async def async_remove_config(
+    hass: HomeAssistant, hash_: str, removed_entry_id: str | None = None
+) -> None:
+    """Remove a stored configuration unless another entry still uses it."""
+    if any(
+        entry.data.get(CONF_CONFIG_HASH) == hash_
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != removed_entry_id
+    ):
+        return
+    await _store(hass, hash_).async_remove()
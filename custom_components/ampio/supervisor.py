@@ -0,0 +1,144 @@
+"""Supervision of the CAN gateway connection."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_SILENCE_TIMEOUT
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from caneth import WaveShareCANClient
+
+    from .bridge import AmpioBridge
+
+# seconds between link checks
+CHECK_INTERVAL = 5
+# seconds the client gets to report a live link during a check
+LINK_CHECK_TIMEOUT = 1
+# seconds to wait for a single reconnect attempt
+CONNECT_TIMEOUT = 10
+# bounds of the delay between reconnect attempts, in seconds
+BACKOFF_INITIAL = 1
+BACKOFF_MAX = 60
+
+
+class ConnectionSupervisor:
+    """
+    Watch the gateway link and restore it when it is lost.
+
+    Link loss is either reported by the client or, if a silence timeout is
+    configured, detected as a silent bus. All entities are then marked
+    unavailable in one pass and the client is restarted with jittered
+    exponential backoff. Once connected again, the entities are made
+    available and their state republished in one pass.
+
+    The supervisor is stopped before the client is closed on unload, so it
+    never restarts a client that is shutting down.
+    """
+
+    def __init__(self, bridge: AmpioBridge) -> None:
+        """Initialize the supervisor of a bridge."""
+        self.bridge = bridge
+        self.connected_since: datetime | None = None
+        self.last_disconnect: datetime | None = None
+        self.disconnects = 0
+        self.reconnects = 0
+        # a bus silent for this long means a half-open connection, e.g. after
+        # the gateway rebooted; 0 for buses without periodic broadcasts
+        self.silence_timeout: float = bridge.config_entry.options.get(
+            CONF_SILENCE_TIMEOUT, 0
+        )
+        self._last_frame = time.monotonic()
+        self._stopping = False
+
+    @property
+    def client(self) -> WaveShareCANClient:
+        """Return the gateway client."""
+        return self.bridge.api.transport.client
+
+    @property
+    def uptime(self) -> float | None:
+        """Return the seconds since the link was established."""
+        if self.connected_since is None:
+            return None
+        return (dt_util.utcnow() - self.connected_since).total_seconds()
+
+    @callback
+    def async_frame_received(self) -> None:
+        """Record bus activity."""
+        self._last_frame = time.monotonic()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop supervising, the client is about to be closed."""
+        self._stopping = True
+
+    async def _async_link_lost(self) -> bool:
+        """Return True if the client lost the connection or the bus is silent."""
+        try:
+            await self.client.wait_connected(LINK_CHECK_TIMEOUT)
+        except TimeoutError:
+            return True
+        return bool(self.silence_timeout) and (
+            time.monotonic() - self._last_frame > self.silence_timeout
+        )
+
+    @callback
+    def async_set_connected(self, *, connected: bool) -> None:
+        """Update the link state and write all entities in a single pass."""
+        self.bridge.connected = connected
+        if connected:
+            self.connected_since = dt_util.utcnow()
+            self._last_frame = time.monotonic()
+        else:
+            self.connected_since = None
+            self.last_disconnect = dt_util.utcnow()
+            self.disconnects += 1
+        for entity in list(self.bridge.entities.values()):
+            entity.async_write_ha_state()
+
+    async def async_run(self) -> None:
+        """Supervise the link until stopped or cancelled."""
+        while not self._stopping:
+            await asyncio.sleep(CHECK_INTERVAL)
+            if self._stopping or not await self._async_link_lost():
+                continue
+
+            self.bridge.logger.warning(
+                "Lost connection to Ampio CAN Bridge at %s:%s",
+                self.bridge.host,
+                self.bridge.port,
+            )
+            self.async_set_connected(connected=False)
+            if not await self.async_reconnect():
+                return
+            self.reconnects += 1
+            self.async_set_connected(connected=True)
+            self.bridge.logger.info(
+                "Connection to Ampio CAN Bridge at %s:%s restored",
+                self.bridge.host,
+                self.bridge.port,
+            )
+
+    async def async_reconnect(self) -> bool:
+        """Restart the client until it connects, False if stopped first."""
+        delay = BACKOFF_INITIAL
+        while not self._stopping:
+            await self.client.close()
+            await self.client.start()
+            try:
+                await self.client.wait_connected(CONNECT_TIMEOUT)
+            except TimeoutError:
+                await asyncio.sleep(random.uniform(delay / 2, delay))  # noqa: S311
+                delay = min(BACKOFF_MAX, delay * 2)
+            else:
+                return True
+        return False
@@ -5,18 +5,18 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
-from homeassistant.core import HomeAssistant, callback
 
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.switch import SwitchesController
     from aioampio.models.switch import Switch
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -33,14 +33,9 @@ async def async_setup_entry(
     controller: SwitchesController = api.switches
     make_switch_entity = partial(AmpioSwitch, bridge, controller)
 
-    @callback
-    def async_add_switch(event_type: EventType, resource: Switch) -> None:
-        """Add Ampio Switch."""
-        async_add_entities([make_switch_entity(resource)])
-
     async_add_entities(make_switch_entity(switch) for switch in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_switch, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_switch_entity, async_add_entities
     )
 
 
@@ -63,12 +58,28 @@ class AmpioSwitch(AmpioBaseEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return True if the light is on."""
-        return bool(self.resource.state)
+        return bool(self._expected_value("state", bool(self.resource.state)))
+
+    def _confirmed_state(self) -> dict[str, Any]:
+        """Return the last state reported on the CAN bus."""
+        return {"state": bool(self.resource.state)}
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.controller.set_state(id=self.resource.id, on=True)
+        await self.async_send_state(on=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.controller.set_state(id=self.resource.id, on=False)
+        await self.async_send_state(on=False)
+
+    async def async_send_state(
+        self,
+        *,
+        on: bool,
+        brightness: int | None = None,
+    ) -> None:
+        """Switch the output, brightness is accepted for bulk commands only."""
+        await self._async_send_tracked(
+            {"state": on}, self.controller.set_state(id=self.resource.id, on=on)
+        )
+        self._async_record_command()
@@ -5,18 +5,18 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.text import (
     TextEntity,
     TextEntityDescription,
 )
-from homeassistant.core import HomeAssistant, callback
 
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.text import TextsController
     from aioampio.models.text import Text
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -33,14 +33,9 @@ async def async_setup_entry(
     controller: TextsController = api.texts
     make_text_entity = partial(AmpioText, bridge, controller)
 
-    @callback
-    def async_add_text(event_type: EventType, resource: Text) -> None:
-        """Add Ampio Text."""
-        async_add_entities([make_text_entity(resource)])
-
     async_add_entities(make_text_entity(text) for text in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_text, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_text_entity, async_add_entities
     )
 
 
@@ -5,20 +5,22 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from aioampio.controllers.events import EventType
 from homeassistant.components.valve import (
     ATTR_CURRENT_POSITION,
     ValveEntity,
     ValveEntityDescription,
     ValveEntityFeature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
 
+from .commands import CommandQueue
+from .discovery import async_setup_discovery
 from .entity import AmpioBaseEntity
 
 if TYPE_CHECKING:
     from aioampio.controllers.valves import ValvesController
     from aioampio.models.valve import Valve
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .bridge import AmpioBridge, AmpioConfigEntry
@@ -35,14 +37,9 @@ async def async_setup_entry(
     controller: ValvesController = api.valves
     make_valve_entity = partial(AmpioValve, bridge, controller)
 
-    @callback
-    def async_add_valve(event_type: EventType, resource: Valve) -> None:
-        """Add Ampio Valve."""
-        async_add_entities([make_valve_entity(resource)])
-
     async_add_entities(make_valve_entity(valve) for valve in controller)
-    config_entry.async_on_unload(
-        controller.subscribe(async_add_valve, event_filter=EventType.RESOURCE_ADDED)
+    async_setup_discovery(
+        hass, config_entry, controller, make_valve_entity, async_add_entities
     )
 
 
@@ -61,6 +58,7 @@ class AmpioValve(AmpioBaseEntity, ValveEntity):
         """Initialize the Ampio valve."""
         super().__init__(bridge, controller, resource)
         self.name = resource.name
+        self._commands = CommandQueue(bridge, Platform.VALVE, self.module_id)
         self._attr_supported_features = (
             ValveEntityFeature.OPEN
             | ValveEntityFeature.CLOSE
@@ -68,6 +66,10 @@ class AmpioValve(AmpioBaseEntity, ValveEntity):
             | ValveEntityFeature.STOP
         )
 
+    def _state_fingerprint(self) -> tuple[str | None, int | None]:
+        """Return the state and position snapshot of the valve."""
+        return self.resource.state, self.resource.valve.position
+
     @property
     def state(self) -> str:
         """Return the state of the valve."""
@@ -85,19 +87,25 @@ class AmpioValve(AmpioBaseEntity, ValveEntity):
 
     async def async_set_valve_position(self, position: int) -> None:
         """Move the valve to a specific position."""
-        await self.controller.set_position(
-            self.resource.id,
-            position=position,
+        await self._commands.async_set_point(
+            "position",
+            partial(self.controller.set_position, self.resource.id, position=position),
         )
 
     async def async_stop_valve(self) -> None:
         """Stop the valve."""
-        await self.controller.stop_valve(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.stop_valve, self.resource.id)
+        )
 
     async def async_open_valve(self) -> None:
         """Open the valve."""
-        await self.controller.open_valve(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.open_valve, self.resource.id)
+        )
 
     async def async_close_valve(self) -> None:
         """Close the valve."""
-        await self.controller.close_valve(self.resource.id)
+        await self._commands.async_cut_through(
+            partial(self.controller.close_valve, self.resource.id)
+        )
@@ -0,0 +1,84 @@
+"""Benchmarks of the Ampio integration hot paths, import time and memory."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+
+def run_benchmark(  # noqa: PLR0913
+    doc: str,
+    baseline_file: Path,
+    run: Callable[[], dict[str, float]],
+    *,
+    tolerance: float,
+    min_delta: float,
+    unit: str,
+    repeat: int = 1,
+    value_format: str = "10.3f",
+    name_width: int = 28,
+    details: Callable[[str], Iterable[str]] | None = None,
+    footer: str | None = None,
+) -> None:
+    """
+    Run a benchmark and save or compare its baseline.
+
+    The benchmark is run ``repeat`` times and the best result of every
+    entry is kept. Without a baseline the results are recorded as the
+    baseline. Otherwise the run exits with status 1 when a result is more
+    than ``tolerance`` and at least ``min_delta`` over its baseline, the
+    latter keeping noise on tiny values from failing the run.
+    """
+    parser = argparse.ArgumentParser(description=doc.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="store as the baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=tolerance,
+        help=f"allowed increase, {tolerance} = {tolerance * 100:.0f}%%",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=repeat, help="runs to keep the best of"
+    )
+    args = parser.parse_args()
+
+    results = run()
+    for _ in range(args.repeat - 1):
+        for name, value in run().items():
+            results[name] = min(results[name], value)
+
+    if args.save or not baseline_file.exists():
+        if not args.save:
+            sys.stdout.write(f"No baseline in {baseline_file}, recording it\n")
+        baseline_file.parent.mkdir(exist_ok=True)
+        baseline_file.write_text(json.dumps(results, indent=2) + "\n")
+
+    baseline = json.loads(baseline_file.read_text())
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        marker = ""
+        if (
+            base is not None
+            and value > base * (1 + args.tolerance)
+            and value - base >= min_delta
+        ):
+            regressions.append(name)
+            marker = "  REGRESSION"
+        sys.stdout.write(
+            f"{name:{name_width}} {value:{value_format}} {unit}"
+            f"  (baseline {base}){marker}\n"
+        )
+        for line in details(name) if details is not None else ():
+            sys.stdout.write(f"    {line}\n")
+    if footer is not None:
+        sys.stdout.write(f"{footer}\n")
+
+    if regressions:
+        sys.exit(1)
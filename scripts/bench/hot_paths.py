@@ -0,0 +1,364 @@
+"""
+Benchmark the entity hot paths against a stored baseline.
+
+Entities are built on a fake bridge and controller holding thousands of
+synthetic resources, so neither a running Home Assistant nor a gateway is
+needed. State writes are replaced by a no-op to time the integration code
+only.
+
+The setup of every platform and the device registry reconciliation are
+timed the same way, the latter on an in-memory device registry.
+
+    python3 -m scripts.bench.hot_paths --save     # store the baseline
+    python3 -m scripts.bench.hot_paths            # compare, exit 1 on regression
+
+Every path is timed as the best of several rounds, and the benchmark as
+the best of 3 runs.
+"""
+
+import asyncio
+import importlib
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+from aioampio.controllers.events import EventType
+from aioampio.models.alarm_control_panel import AlarmControlPanel
+from aioampio.models.binary_sensor import BinarySensor
+from aioampio.models.climate import Climate
+from aioampio.models.config import DeviceType
+from aioampio.models.cover import Cover, CoverState
+from aioampio.models.device import Device
+from aioampio.models.light import Light
+from aioampio.models.resource import ResourceTypes
+from aioampio.models.sensor import Sensor
+from aioampio.models.switch import Switch
+from aioampio.models.text import Text
+from aioampio.models.valve import Valve, ValveState
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+
+from custom_components.ampio import device as ampio_device
+from custom_components.ampio.alarm_control_panel import AmpioAlarm
+from custom_components.ampio.bridge import RESOURCE_CONTROLLERS, AmpioBridge
+from custom_components.ampio.const import PLATFORMS
+from custom_components.ampio.cover import AmpioCover
+from custom_components.ampio.light import AmpioLight
+
+from . import run_benchmark
+
+BASELINE_FILE = Path.cwd() / ".benchmarks" / "hot_paths.json"
+RESOURCES = 2000
+DEVICES = 200
+REPEAT = 5
+
+
+class FakeController:
+    """Controller holding synthetic resources, all owned by one module."""
+
+    def __init__(self, resources: list[Any]) -> None:
+        """Initialize the controller."""
+        self.resources = resources
+        self.device = SimpleNamespace(id="bench_module")
+
+    def __iter__(self) -> Any:
+        """Iterate the resources."""
+        return iter(self.resources)
+
+    def get_device(self, _resource_id: str) -> Any:
+        """Return the module owning a resource."""
+        return self.device
+
+    def subscribe(self, *_args: Any, **_kwargs: Any) -> Any:
+        """Accept a subscription, no events are sent."""
+        return lambda: None
+
+
+class FakeDeviceRegistry:
+    """In-memory device registry with the calls used by the reconciliation."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.devices: dict[str, SimpleNamespace] = {}
+        self._by_identifier: dict[tuple[str, str], SimpleNamespace] = {}
+
+    def async_get_device(self, identifiers: set[tuple[str, str]]) -> Any:
+        """Return the device with one of the identifiers."""
+        for identifier in identifiers:
+            if device := self._by_identifier.get(identifier):
+                return device
+        return None
+
+    def async_get_or_create(
+        self, *, config_entry_id: str, identifiers: set[tuple[str, str]], **params: Any
+    ) -> Any:
+        """Register a device."""
+        device = SimpleNamespace(
+            id=str(len(self.devices)),
+            config_entry_id=config_entry_id,
+            identifiers=identifiers,
+            area_id=None,
+            **params,
+        )
+        self.devices[device.id] = device
+        for identifier in identifiers:
+            self._by_identifier[identifier] = device
+        return device
+
+    def async_update_device(self, device_id: str, **changes: Any) -> Any:
+        """Update the fields of a device."""
+        device = self.devices[device_id]
+        for key, value in changes.items():
+            setattr(device, key, value)
+        return device
+
+    def async_remove_device(self, device_id: str) -> None:
+        """Remove a device."""
+        device = self.devices.pop(device_id)
+        for identifier in device.identifiers:
+            self._by_identifier.pop(identifier, None)
+
+    def entries_for_config_entry(self, entry_id: str) -> list[Any]:
+        """Return the devices of a config entry."""
+        return [
+            device
+            for device in self.devices.values()
+            if device.config_entry_id == entry_id
+        ]
+
+
+def fake_bridge(**controllers: Any) -> AmpioBridge:
+    """
+    Return a bridge built by its constructor on a fake entry.
+
+    The aioampio bridge is replaced by the given controllers, e.g.
+    lights=FakeController(...).
+    """
+    entry = SimpleNamespace(
+        entry_id="bench",
+        unique_id="bench",
+        data={CONF_HOST: "bench", CONF_PORT: 20001},
+        options={},
+        unload_callbacks=[],
+    )
+    entry.async_on_unload = entry.unload_callbacks.append
+    bridge = AmpioBridge(SimpleNamespace(), entry)
+    bridge.api = SimpleNamespace(**controllers)
+    return bridge
+
+
+def make_entities(entity_cls: type, resources: list[Any]) -> list[Any]:
+    """Create entities whose state writes are no-ops."""
+    bridge = fake_bridge()
+    controller = FakeController(resources)
+    entities = [entity_cls(bridge, controller, resource) for resource in resources]
+    for entity in entities:
+        entity.async_write_ha_state = lambda: None
+    return entities
+
+
+def lights() -> list[Light]:
+    """Return dimmable RGBW lights with a full state."""
+    return [
+        Light(
+            id=f"light_{i}",
+            on=True,
+            dimming=True,
+            color=True,
+            state={
+                "state": True,
+                "brightness": i % 256,
+                "red": 1,
+                "green": 2,
+                "blue": 3,
+                "white": 4,
+            },
+        )
+        for i in range(RESOURCES)
+    ]
+
+
+def alarms() -> list[AlarmControlPanel]:
+    """Return armed alarm zones."""
+    return [
+        AlarmControlPanel(
+            id=f"alarm_{i}",
+            state={
+                "armed": True,
+                "arming": False,
+                "arming_10s": False,
+                "breached": False,
+                "alarm": False,
+            },
+        )
+        for i in range(RESOURCES)
+    ]
+
+
+def covers() -> list[Cover]:
+    """Return half open covers."""
+    resources = [
+        Cover(id=f"cover_{i}", state=CoverState.OPEN) for i in range(RESOURCES)
+    ]
+    for cover in resources:
+        cover.cover.position = 50
+        cover.tilt.position = 25
+    return resources
+
+
+def platform_resources() -> dict[Platform, list[Any]]:
+    """Return the resources set up by every platform."""
+    ids = range(RESOURCES)
+    return {
+        Platform.LIGHT: lights(),
+        Platform.ALARM_CONTROL_PANEL: alarms(),
+        Platform.TEXT: [Text(id=f"text_{i}", state="text") for i in ids],
+        Platform.BINARY_SENSOR: [
+            BinarySensor(id=f"binary_sensor_{i}", state="on") for i in ids
+        ],
+        Platform.SENSOR: [
+            Sensor(id=f"sensor_{i}", state=21.5, device_class="temperature")
+            for i in ids
+        ],
+        Platform.SWITCH: [Switch(id=f"switch_{i}", on=True) for i in ids],
+        Platform.COVER: covers(),
+        Platform.VALVE: [Valve(id=f"valve_{i}", state=ValveState.OPEN) for i in ids],
+        Platform.CLIMATE: [
+            Climate(
+                id=f"climate_{i}", current_temperature=21.0, target_temperature=22.0
+            )
+            for i in ids
+        ],
+    }
+
+
+def devices() -> list[Device]:
+    """Return CAN modules without an area."""
+    return [
+        Device(
+            id=f"module_{i}",
+            can_id=i,
+            model=DeviceType.MRGBW,
+            name=f"Module {i}",
+            sw_version=1,
+            pcb=2,
+        )
+        for i in range(DEVICES)
+    ]
+
+
+def measure(name: str, func: Any, ops: int, results: dict[str, float]) -> None:
+    """Store the best time of a single operation in microseconds."""
+    best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    results[name] = round(best / ops * 1_000_000, 3)
+
+
+def run() -> dict[str, float]:
+    """Run all benchmarks."""
+    results: dict[str, float] = {}
+    loop = asyncio.new_event_loop()
+
+    light_resources = lights()
+    light_entities = make_entities(AmpioLight, light_resources)
+    alarm_entities = make_entities(AmpioAlarm, alarms())
+    cover_entities = make_entities(AmpioCover, covers())
+
+    resources = platform_resources()
+    for platform in PLATFORMS:
+        module = importlib.import_module(f"custom_components.ampio.{platform}")
+        controllers = {
+            RESOURCE_CONTROLLERS[ResourceTypes(platform.value)]: FakeController(
+                resources[platform]
+            )
+        }
+
+        def setup_entry(module: Any = module, controllers: Any = controllers) -> None:
+            bridge = fake_bridge(**controllers)
+            added: list[Any] = []
+            loop.run_until_complete(
+                module.async_setup_entry(bridge.hass, bridge.config_entry, added.extend)
+            )
+
+        measure(f"{platform}_setup_entry", setup_entry, RESOURCES, results)
+
+    # registry reconciliation of a reload, all modules already registered
+    registry = FakeDeviceRegistry()
+    device_bridge = fake_bridge(devices=FakeController(devices()))
+    fake_dr = SimpleNamespace(
+        async_get=lambda _hass: registry,
+        async_entries_for_config_entry=lambda reg, entry_id: (
+            reg.entries_for_config_entry(entry_id)
+        ),
+    )
+    with mock.patch.object(ampio_device, "dr", fake_dr):
+        loop.run_until_complete(ampio_device.async_setup_devices(device_bridge))
+        measure(
+            "devices_reconcile",
+            lambda: loop.run_until_complete(
+                ampio_device.async_setup_devices(device_bridge)
+            ),
+            DEVICES,
+            results,
+        )
+
+    measure(
+        "light_init",
+        lambda: make_entities(AmpioLight, light_resources),
+        RESOURCES,
+        results,
+    )
+
+    def handle_events() -> None:
+        for entity in light_entities:
+            # force a write, the state is unchanged between rounds
+            entity._last_state = None  # noqa: SLF001
+            entity._handler_event(EventType.RESOURCE_UPDATED, entity.resource)  # noqa: SLF001
+
+    measure("light_handler_event", handle_events, RESOURCES, results)
+    measure(
+        "light_rgbw_color",
+        lambda: [entity.rgbw_color for entity in light_entities],
+        RESOURCES,
+        results,
+    )
+    measure(
+        "light_properties",
+        lambda: [
+            (entity.is_on, entity.brightness, entity.color_mode, entity.rgbw_color)
+            for entity in light_entities
+        ],
+        RESOURCES,
+        results,
+    )
+    measure(
+        "alarm_state",
+        lambda: [entity.alarm_state for entity in alarm_entities],
+        RESOURCES,
+        results,
+    )
+    measure(
+        "cover_state_attributes",
+        lambda: [entity.state_attributes for entity in cover_entities],
+        RESOURCES,
+        results,
+    )
+    loop.close()
+    return results
+
+
+def main() -> None:
+    """Run the benchmarks and save or compare the baseline."""
+    run_benchmark(
+        __doc__,
+        BASELINE_FILE,
+        run,
+        tolerance=0.2,
+        min_delta=0.1,
+        unit="us/op",
+        repeat=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
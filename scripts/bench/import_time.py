@@ -0,0 +1,92 @@
+"""
+Benchmark the cold import time of the integration against a stored baseline.
+
+Every target is imported in a fresh interpreter started with
+``-X importtime``; the cumulative time of the target module is kept, best
+of several runs. Modules pulled in by Home Assistant itself are counted
+too, so only compare baselines taken in the same environment.
+
+    python3 -m scripts.bench.import_time --save     # store the baseline
+    python3 -m scripts.bench.import_time            # compare, exit 1 on regression
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from . import run_benchmark
+
+BASELINE_FILE = Path.cwd() / ".benchmarks" / "import_time.json"
+REPEAT = 5
+
+# modules imported by Home Assistant before any entry is set up
+TARGETS = (
+    "custom_components.ampio",
+    "custom_components.ampio.config_flow",
+)
+# number of the most expensive modules listed per target
+TOP_MODULES = 5
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return the self and cumulative import time of every module, in us."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def run() -> tuple[dict[str, float], dict[str, list[tuple[str, int]]]]:
+    """Return the best cumulative import time and top modules of every target."""
+    results: dict[str, float] = {}
+    top: dict[str, list[tuple[str, int]]] = {}
+    for target in TARGETS:
+        best = None
+        for _ in range(REPEAT):
+            times = import_times(target)
+            if best is None or times[target][1] < best[target][1]:
+                best = times
+        results[target] = round(best[target][1] / 1000, 3)
+        top[target] = sorted(
+            ((name, cumulative) for name, (_, cumulative) in best.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )[1 : TOP_MODULES + 1]
+    return results, top
+
+
+def main() -> None:
+    """Run the benchmark and save or compare the baseline."""
+    top: dict[str, list[tuple[str, int]]] = {}
+
+    def measure() -> dict[str, float]:
+        results, found = run()
+        top.update(found)
+        return results
+
+    run_benchmark(
+        __doc__,
+        BASELINE_FILE,
+        measure,
+        tolerance=0.2,
+        min_delta=1.0,
+        unit="ms",
+        name_width=40,
+        details=lambda name: (
+            f"{module:52} {cumulative / 1000:8.3f} ms"
+            for module, cumulative in top[name]
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
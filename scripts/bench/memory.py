@@ -0,0 +1,65 @@
+"""
+Benchmark the memory used per entity against a stored baseline.
+
+Entities are built with the fake bridge and controllers of the hot path
+benchmark; the memory allocated while creating them, as traced by
+tracemalloc, is divided by the number of entities. The resources
+themselves are allocated before tracing starts and are not counted.
+
+    python3 -m scripts.bench.memory --save     # store the baseline
+    python3 -m scripts.bench.memory            # compare, exit 1 on regression
+"""
+
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from custom_components.ampio.alarm_control_panel import AmpioAlarm
+from custom_components.ampio.cover import AmpioCover
+from custom_components.ampio.light import AmpioLight
+
+from . import run_benchmark
+from .hot_paths import RESOURCES, alarms, covers, lights, make_entities
+
+BASELINE_FILE = Path.cwd() / ".benchmarks" / "memory.json"
+
+
+def bytes_per_entity(entity_cls: type, resources: list[Any]) -> int:
+    """Return the memory allocated per entity created for the resources."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        entities = make_entities(entity_cls, resources)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return round(used / len(entities))
+
+
+def run() -> dict[str, int]:
+    """Run all benchmarks."""
+    return {
+        "light": bytes_per_entity(AmpioLight, lights()),
+        "alarm_control_panel": bytes_per_entity(AmpioAlarm, alarms()),
+        "cover": bytes_per_entity(AmpioCover, covers()),
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and save or compare the baseline."""
+    run_benchmark(
+        __doc__,
+        BASELINE_FILE,
+        run,
+        tolerance=0.1,
+        min_delta=16,
+        unit="B/entity",
+        value_format="10d",
+        footer=f"{RESOURCES} entities per platform",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Fixtures for the Ampio integration tests."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.const import CONF_HOST, CONF_PORT
+
+from custom_components.ampio.bridge import AmpioBridge
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FakeScheduler:
+    """Stand-in for async_call_later running the callbacks on demand."""
+
+    def __init__(self) -> None:
+        """Initialize without scheduled callbacks."""
+        self.scheduled: list[tuple[float, Callable[[Any], None]]] = []
+
+    def call_later(
+        self, _hass: Any, delay: float, action: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        """Schedule a callback and return its cancel function."""
+        item = (delay, action)
+        self.scheduled.append(item)
+
+        def cancel() -> None:
+            if item in self.scheduled:
+                self.scheduled.remove(item)
+
+        return cancel
+
+    def fire(self) -> None:
+        """Run the callbacks scheduled so far."""
+        scheduled, self.scheduled = self.scheduled, []
+        for _, action in scheduled:
+            action(None)
+
+
+@pytest.fixture
+def scheduler() -> FakeScheduler:
+    """Return a scheduler to patch async_call_later with."""
+    return FakeScheduler()
+
+
+@pytest.fixture
+def make_bridge() -> Callable[..., AmpioBridge]:
+    """Return a factory of bridges built on a fake entry with the given options."""
+
+    def factory(**options: Any) -> AmpioBridge:
+        entry = SimpleNamespace(
+            entry_id="test",
+            unique_id="test",
+            data={CONF_HOST: "test", CONF_PORT: 20001},
+            options=options,
+            unload_callbacks=[],
+        )
+        entry.async_on_unload = entry.unload_callbacks.append
+        return AmpioBridge(SimpleNamespace(), entry)
+
+    return factory
@@ -0,0 +1,50 @@
+"""Tests for the decoding of Ampio alarm zone flags."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+
+from custom_components.ampio.alarm_control_panel import (
+    ALARM,
+    ARMED,
+    ARMING,
+    ARMING_10S,
+    BREACHED,
+    STATE_TABLE,
+    decode_flags,
+)
+
+
+@pytest.mark.parametrize(
+    ("state", "mask"),
+    [
+        ({}, 0),
+        ({"armed": False, "alarm": False}, 0),
+        ({"armed": True}, ARMED),
+        ({"arming": True, "arming_10s": True}, ARMING | ARMING_10S),
+        ({"armed": True, "breached": True, "alarm": True}, ARMED | BREACHED | ALARM),
+        # only an explicit True sets a flag
+        ({"armed": 1, "alarm": None}, 0),
+    ],
+)
+def test_decode_flags(state: dict[str, object], mask: int) -> None:
+    """Test the zone flags are decoded into a bitmask."""
+    assert decode_flags(state) == mask
+
+
+@pytest.mark.parametrize(
+    ("mask", "alarm_state"),
+    [
+        (0, AlarmControlPanelState.DISARMED),
+        (ARMED, AlarmControlPanelState.ARMED_AWAY),
+        (ARMING, AlarmControlPanelState.ARMING),
+        (ARMING_10S, AlarmControlPanelState.ARMING),
+        (ARMED | BREACHED, AlarmControlPanelState.PENDING),
+        (ARMED | BREACHED | ALARM, AlarmControlPanelState.ALARM_TRIGGERED),
+        (ALARM | ARMING, AlarmControlPanelState.ALARM_TRIGGERED),
+    ],
+)
+def test_state_table(mask: int, alarm_state: AlarmControlPanelState) -> None:
+    """Test the most severe flag decides the zone state."""
+    assert STATE_TABLE[mask] == alarm_state
@@ -0,0 +1,157 @@
+"""Tests for the collapsing of Ampio set-point commands."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+
+from custom_components.ampio.commands import CommandQueue
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+    from .conftest import FakeScheduler
+
+
+class Recorder:
+    """Commands recording the values they send."""
+
+    def __init__(self) -> None:
+        """Initialize without sent commands."""
+        self.sent: list[Any] = []
+
+    def command(
+        self, value: Any, sending: asyncio.Event | None = None
+    ) -> Callable[[], Coroutine[Any, Any, None]]:
+        """Return a command sending the value, optionally until sending is set."""
+
+        async def send() -> None:
+            if sending is not None:
+                await sending.wait()
+            self.sent.append(value)
+
+        return send
+
+
+def _create_task(_hass: Any, target: Coroutine[Any, Any, None], _name: str) -> Any:
+    return asyncio.get_running_loop().create_task(target)
+
+
+@pytest.fixture
+def queue(scheduler: FakeScheduler) -> Iterator[CommandQueue]:
+    """Return a command queue of a light on a fake bridge."""
+    bridge = SimpleNamespace(
+        hass=None,
+        config_entry=SimpleNamespace(async_create_background_task=_create_task),
+        collapsed_commands=Counter(),
+        metrics=None,
+        logger=logging.getLogger(__name__),
+    )
+    with mock.patch(
+        "custom_components.ampio.commands.async_call_later", scheduler.call_later
+    ):
+        yield CommandQueue(bridge, "light", "module")
+
+
+async def _close_window(scheduler: FakeScheduler) -> None:
+    """Close the command window and let the held set-points be sent."""
+    scheduler.fire()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_set_points_collapse_to_the_latest(
+    queue: CommandQueue, scheduler: FakeScheduler
+) -> None:
+    """Test only the first and last set-point of a window are sent."""
+    recorder = Recorder()
+
+    async def scenario() -> None:
+        for value in (1, 2, 3):
+            await queue.async_set_point("brightness", recorder.command(value))
+        assert recorder.sent == [1]
+
+        await _close_window(scheduler)
+        assert recorder.sent == [1, 3]
+
+    asyncio.run(scenario())
+    assert queue.bridge.collapsed_commands == {"light": 1}
+
+
+def test_set_points_collapse_by_key(
+    queue: CommandQueue, scheduler: FakeScheduler
+) -> None:
+    """Test held set-points of different keys are all sent in order."""
+    recorder = Recorder()
+
+    async def scenario() -> None:
+        await queue.async_set_point("brightness", recorder.command("b1"))
+        await queue.async_set_point("brightness", recorder.command("b2"))
+        await queue.async_set_point("color", recorder.command("c1"))
+        await _close_window(scheduler)
+
+    asyncio.run(scenario())
+    assert recorder.sent == ["b1", "b2", "c1"]
+    assert not queue.bridge.collapsed_commands
+
+
+def test_window_stays_open_while_sending(
+    queue: CommandQueue, scheduler: FakeScheduler
+) -> None:
+    """Test a set-point following a held one waits for the next window."""
+    recorder = Recorder()
+
+    async def scenario() -> None:
+        await queue.async_set_point("brightness", recorder.command(1))
+        await queue.async_set_point("brightness", recorder.command(2))
+        await _close_window(scheduler)
+        await queue.async_set_point("brightness", recorder.command(3))
+        assert recorder.sent == [1, 2]
+
+        await _close_window(scheduler)
+        assert recorder.sent == [1, 2, 3]
+
+    asyncio.run(scenario())
+
+
+def test_cut_through_drops_held_set_points(
+    queue: CommandQueue, scheduler: FakeScheduler
+) -> None:
+    """Test a stop is sent immediately and the held set-points are dropped."""
+    recorder = Recorder()
+
+    async def scenario() -> None:
+        await queue.async_set_point("position", recorder.command(10))
+        await queue.async_set_point("position", recorder.command(20))
+        await queue.async_cut_through(recorder.command("stop"))
+        assert recorder.sent == [10, "stop"]
+
+        await _close_window(scheduler)
+        assert recorder.sent == [10, "stop"]
+
+    asyncio.run(scenario())
+    assert queue.bridge.collapsed_commands == {"light": 1}
+
+
+def test_cut_through_cancels_set_point_in_flight(
+    queue: CommandQueue, scheduler: FakeScheduler
+) -> None:
+    """Test a held set-point still being sent never follows a stop."""
+    recorder = Recorder()
+
+    async def scenario() -> None:
+        await queue.async_set_point("position", recorder.command(10))
+        await queue.async_set_point("position", recorder.command(20, asyncio.Event()))
+        await _close_window(scheduler)
+        await queue.async_cut_through(recorder.command("stop"))
+
+        await _close_window(scheduler)
+        assert recorder.sent == [10, "stop"]
+
+    asyncio.run(scenario())
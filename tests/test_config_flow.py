@@ -0,0 +1,33 @@
+"""Tests for the validation of the Ampio options."""
+
+from __future__ import annotations
+
+import pytest
+import voluptuous as vol
+
+from custom_components.ampio.config_flow import validate_flush_window
+from custom_components.ampio.const import MAX_FLUSH_WINDOW
+
+
+def test_flush_window_coerces_values() -> None:
+    """Test the windows are coerced to integer milliseconds."""
+    assert validate_flush_window({"light": "100", "sensor": 250}) == {
+        "light": 100,
+        "sensor": 250,
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["light"],
+        {"kitchen": 100},
+        {"light": -1},
+        {"light": MAX_FLUSH_WINDOW + 1},
+        {"light": "soon"},
+    ],
+)
+def test_flush_window_invalid(value: object) -> None:
+    """Test invalid mappings, platforms and windows are rejected."""
+    with pytest.raises(vol.Invalid):
+        validate_flush_window(value)
@@ -0,0 +1,94 @@
+"""Tests for the diff of parsed Ampio configurations."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from aioampio.models.area import Area
+from aioampio.models.config import DeviceType
+from aioampio.models.device import Device
+from aioampio.models.light import Light
+
+from custom_components.ampio.diff import diff_config
+
+
+def _device(**changes: object) -> Device:
+    return replace(
+        Device(id="module", can_id=0x1234, model=DeviceType.MDIM, name="Module"),
+        **changes,
+    )
+
+
+def _light(**changes: object) -> Light:
+    return replace(Light(id="light", on=False, name="Light", area="Kitchen"), **changes)
+
+
+def test_unchanged_config_is_empty() -> None:
+    """Test identical configurations have nothing to apply."""
+    diff = diff_config([_device(), _light()], [_device(), _light()])
+
+    assert not diff
+    assert not diff.requires_reload
+
+
+def test_metadata_change_applies_in_place() -> None:
+    """Test name and area changes are reported without a reload."""
+    diff = diff_config([_light()], [_light(name="Lamp", area="Hall")])
+
+    assert diff.changed == [(_light(name="Lamp", area="Hall"), {"name", "area"})]
+    assert not diff.requires_reload
+
+
+def test_device_metadata_change_applies_in_place() -> None:
+    """Test a new module firmware is a metadata change."""
+    diff = diff_config([_device()], [_device(sw_version=2)])
+
+    assert diff.changed == [(_device(sw_version=2), {"sw_version"})]
+    assert not diff.requires_reload
+
+
+def test_functional_change_requires_reload() -> None:
+    """Test a change of anything but metadata requires a reload."""
+    diff = diff_config([_light()], [_light(dimming=True)])
+
+    assert diff.requires_reload
+    assert not diff.changed
+
+
+def test_device_can_id_change_requires_reload() -> None:
+    """Test a module moved to another CAN id requires a reload."""
+    assert diff_config([_device()], [_device(can_id=0x4321)]).requires_reload
+
+
+def test_added_resource_applies_in_place() -> None:
+    """Test a new resource of a known module is added without a reload."""
+    diff = diff_config([_device()], [_device(), _light()])
+
+    assert diff.added == [_light()]
+    assert not diff.requires_reload
+
+
+def test_added_device_requires_reload() -> None:
+    """Test a new module requires a reload to filter its CAN id."""
+    diff = diff_config([], [_device()])
+
+    assert diff.added == [_device()]
+    assert diff.requires_reload
+
+
+def test_removed_resource() -> None:
+    """Test a resource missing from the new config is removed."""
+    diff = diff_config([_device(), _light()], [_device()])
+
+    assert diff.removed == [_light()]
+    assert not diff.requires_reload
+
+
+def test_location_changes() -> None:
+    """Test added, changed and removed areas are reported as location changes."""
+    kitchen = Area(id="kitchen", name="Kitchen")
+
+    assert diff_config([], [kitchen]).locations_changed
+    assert diff_config([kitchen], [replace(kitchen, name="Galley")]).locations_changed
+    assert diff_config([kitchen], []).locations_changed
+    assert not diff_config([kitchen], [kitchen]).locations_changed
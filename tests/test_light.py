@@ -0,0 +1,40 @@
+"""Tests for the decoding of Ampio light states."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.components.light import ColorMode
+
+from custom_components.ampio.light import LightSnapshot
+
+RGBW = {ColorMode.RGBW, ColorMode.BRIGHTNESS}
+
+
+@pytest.mark.parametrize(
+    ("state", "color_modes", "color_mode"),
+    [
+        ({}, {ColorMode.ONOFF}, ColorMode.ONOFF),
+        ({"brightness": 10}, {ColorMode.BRIGHTNESS}, ColorMode.BRIGHTNESS),
+        ({}, RGBW, ColorMode.BRIGHTNESS),
+        ({"brightness": 10}, RGBW, ColorMode.BRIGHTNESS),
+        ({"red": 1, "green": 2, "blue": 3, "white": 4}, RGBW, ColorMode.RGBW),
+        # a color is only reported once all channels are known
+        ({"red": 1, "green": 2, "blue": 3}, RGBW, ColorMode.BRIGHTNESS),
+    ],
+)
+def test_color_mode(
+    state: dict[str, int], color_modes: set[ColorMode], color_mode: ColorMode
+) -> None:
+    """Test the color mode follows the values reported by the light."""
+    assert LightSnapshot.from_state(state, color_modes).color_mode == color_mode
+
+
+def test_white_channel_change_is_a_new_snapshot() -> None:
+    """Test a change of the white channel alone is not deduplicated."""
+    state = {"state": True, "red": 1, "green": 2, "blue": 3, "white": 4}
+
+    old = LightSnapshot.from_state(state, RGBW)
+    new = LightSnapshot.from_state({**state, "white": 5}, RGBW)
+
+    assert old != new
+    assert LightSnapshot.from_state(state, RGBW) == old
@@ -0,0 +1,54 @@
+"""Tests for the parsing of downloaded Ampio configurations."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.ampio.loader import ConfigParseError, parse_config
+
+CONFIG = b"""
+devices:
+  - can_id: 0x1234
+    name: Module
+    model: 5
+    lights:
+      - id: "1"
+        name: Lamp
+        states: AOUT.1
+"""
+
+
+def test_config_is_normalized() -> None:
+    """Test the validated model is returned with defaults and derived values."""
+    config = parse_config(CONFIG)
+
+    device = config["devices"][0]
+    assert device["can_id"] == 0x1234
+    assert device["pcb"] == 0
+    assert device["lights"][0]["states"] == ["aout.1"]
+    assert device["lights"][0]["dimming"] is True
+    assert config["areas"] == []
+
+
+def test_formatting_does_not_change_the_config() -> None:
+    """Test files differing only in normalized details parse the same."""
+    reformatted = CONFIG.replace(b"0x1234", b"4660").replace(b"AOUT.1", b"[aout.1]")
+
+    assert parse_config(reformatted) == parse_config(CONFIG)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"devices: [",
+        b"devices: \xc3\x28",
+        b"devices: 1",
+        b"unknown: []",
+    ],
+)
+def test_invalid_config(content: bytes) -> None:
+    """Test undecodable, malformed and invalid files are invalid configs."""
+    with pytest.raises(ConfigParseError) as exc_info:
+        parse_config(content)
+
+    assert exc_info.value.reason == "invalid_config"
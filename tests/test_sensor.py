@@ -0,0 +1,139 @@
+"""Tests for the filtering of Ampio sensor readings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from aioampio.models.sensor import Sensor
+
+from custom_components.ampio.const import CONF_SENSOR_FILTERS
+from custom_components.ampio.sensor import AmpioSensor, SensorFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from custom_components.ampio.bridge import AmpioBridge
+
+    from .conftest import FakeScheduler
+
+
+class FakeController:
+    """Controller of a single module."""
+
+    def get_device(self, _resource_id: str) -> None:
+        """Return no module, the sensor is attached to the bridge."""
+
+
+@pytest.mark.parametrize(
+    ("sensor_filter", "old", "new", "significant"),
+    [
+        (SensorFilter(deadband=0.5), 20.0, 20.4, False),
+        (SensorFilter(deadband=0.5), 20.0, 20.5, True),
+        (SensorFilter(deadband=0.5), 20.0, 19.5, True),
+        (SensorFilter(relative_deadband=0.1), 100, 109, False),
+        (SensorFilter(relative_deadband=0.1), 100, 110, True),
+        (SensorFilter(deadband=1, relative_deadband=0.1), 100, 105, False),
+        (SensorFilter(deadband=100), "low", "high", True),
+        (SensorFilter(deadband=100), "low", "low", False),
+        (SensorFilter(deadband=100), None, 20.0, True),
+    ],
+)
+def test_is_significant(
+    sensor_filter: SensorFilter, old: object, new: object, significant: bool
+) -> None:
+    """Test the deadband applies to numbers and any change of other readings."""
+    assert sensor_filter.is_significant(old, new) is significant
+
+
+class Clock:
+    """Monotonic clock advanced by the test."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(scheduler: FakeScheduler) -> Iterator[Clock]:
+    """Patch the sensor clock and scheduler."""
+    clock = Clock()
+    with (
+        mock.patch("custom_components.ampio.sensor.time.monotonic", clock),
+        mock.patch(
+            "custom_components.ampio.sensor.async_call_later", scheduler.call_later
+        ),
+    ):
+        yield clock
+
+
+def _sensor(
+    make_bridge: Callable[..., AmpioBridge], **sensor_filter: float
+) -> tuple[AmpioSensor, Sensor, list[object]]:
+    """Return a sensor with the filter, its resource and the written values."""
+    resource = Sensor(id="temperature", state=20.0, device_class="temperature")
+    bridge = make_bridge(**{CONF_SENSOR_FILTERS: {"temperature": sensor_filter}})
+    sensor = AmpioSensor(bridge, FakeController(), resource)
+    written: list[object] = []
+    sensor.async_write_ha_state = lambda: written.append(sensor.native_value)
+    sensor.on_update()
+    return sensor, resource, written
+
+
+def test_deadband_drops_small_changes(
+    make_bridge: Callable[..., AmpioBridge], clock: Clock
+) -> None:
+    """Test readings inside the deadband are not written."""
+    sensor, resource, written = _sensor(make_bridge, deadband=0.5)
+
+    resource.state = 20.2
+    sensor.async_update_state()
+    resource.state = 20.6
+    sensor.async_update_state()
+
+    assert written == [20.6]
+
+
+def test_min_interval_holds_back_readings(
+    make_bridge: Callable[..., AmpioBridge], clock: Clock, scheduler: FakeScheduler
+) -> None:
+    """Test readings within the minimum interval are published once it ends."""
+    sensor, resource, written = _sensor(make_bridge, min_interval=10)
+
+    clock.now += 11
+    resource.state = 21.0
+    sensor.async_update_state()
+    assert written == [21.0]
+
+    clock.now += 1
+    resource.state = 22.0
+    sensor.async_update_state()
+    resource.state = 23.0
+    sensor.async_update_state()
+    assert written == [21.0]
+    assert [delay for delay, _ in scheduler.scheduled] == [9]
+
+    scheduler.fire()
+    assert written == [21.0, 23.0]
+
+
+def test_heartbeat_republishes_unchanged_reading(
+    make_bridge: Callable[..., AmpioBridge], clock: Clock, scheduler: FakeScheduler
+) -> None:
+    """Test the heartbeat publishes the latest reading held in the deadband."""
+    sensor, resource, written = _sensor(make_bridge, deadband=1, heartbeat=60)
+    assert [delay for delay, _ in scheduler.scheduled] == [60]
+
+    resource.state = 20.5
+    sensor.async_update_state()
+    assert written == []
+
+    scheduler.fire()
+    assert written == [20.5]
+    # every publish restarts the heartbeat
+    assert [delay for delay, _ in scheduler.scheduled] == [60]